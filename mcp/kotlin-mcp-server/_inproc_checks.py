@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+In-process formatter and linter checks for the essential pre-commit hook
+Runs isort, black and flake8 back-to-back inside one interpreter so the hook
+pays a single Python start-up instead of one per tool. Prints a JSON object of
+{check description: [return code, output]} and exits non-zero if any failed.
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+CheckResult = Tuple[int, str]
+
+
+def _capture(func: Callable[[], int]) -> CheckResult:
+    """Run func with stdout/stderr captured, mapping SystemExit to a return code"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        try:
+            code = func()
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except Exception as e:  # report tool crashes as failures, not hook crashes
+            print(f"{type(e).__name__}: {e}")
+            code = 1
+    return code or 0, buffer.getvalue()
+
+
+def _isort() -> int:
+    from isort.main import main as isort_main
+
+    isort_main(["--check-only", "--profile=black", "--line-length=100", "--skip=.venv", "."])
+    return 0
+
+
+def _black() -> int:
+    import black
+
+    return black.main(
+        [
+            "--check",
+            "--line-length=100",
+            "--exclude=.venv|__pycache__|htmlcov",
+            ".",
+        ],
+        standalone_mode=False,
+    )
+
+
+def _flake8() -> int:
+    from flake8.main.application import Application
+
+    # flake8 writes reports to sys.stdout.buffer, which redirect_stdout cannot see,
+    # so route them through a temporary file instead
+    with tempfile.NamedTemporaryFile("r", suffix=".txt", delete=False) as report:
+        report_path = report.name
+    try:
+        app = Application()
+        app.run(
+            [
+                "--max-line-length=100",
+                "--extend-ignore=E203,W503,E501,C901",
+                "--exclude=__pycache__,.venv,htmlcov",
+                f"--output-file={report_path}",
+                ".",
+            ]
+        )
+        print(Path(report_path).read_text(encoding="utf-8"), end="")
+        return app.exit_code()
+    finally:
+        os.unlink(report_path)
+
+
+CHECKS: List[Tuple[str, Callable[[], int]]] = [
+    ("Import sorting check", _isort),
+    ("Code formatting check", _black),
+    ("Code linting check", _flake8),
+]
+
+
+def main() -> None:
+    """Run every check from the project root and print the JSON summary"""
+    os.chdir(Path(__file__).parent)
+    results: Dict[str, CheckResult] = {
+        description: _capture(check) for description, check in CHECKS
+    }
+    print(json.dumps(results))
+    sys.exit(1 if any(code for code, _ in results.values()) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ class Config:
         "MCP_CACHE_SIZE_MB": 100,
         "MCP_CIRCUIT_BREAKER_THRESHOLD": 5,
         "MCP_CIRCUIT_BREAKER_TIMEOUT_MS": 60000,
+        "MCP_MAX_CONCURRENT_TOOLS": 64,
+        "MCP_BCRYPT_ROUNDS": 12,
         # Hardening configuration
         "RATE_LIMIT_REQUESTS": 100,
         "RATE_LIMIT_WINDOW": 60,
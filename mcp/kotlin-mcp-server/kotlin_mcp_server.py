@@ -28,17 +28,30 @@ import sys
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, ValidationError
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import existing tool modules
 from ai.llm_integration import AnalysisRequest, CodeGenerationRequest, CodeType, LLMIntegration
+from config import Config
 from generators.kotlin_generator import KotlinCodeGenerator
+from tools.build_and_test_tool import BuildAndTestTool
 from tools.build_optimization import BuildOptimizationTools
 from tools.gradle_tools import GradleTools
+from tools.intelligent_build_tools import IntelligentGitTool
+from tools.intelligent_external_api_tools import IntelligentExternalAPITool
+from tools.intelligent_qol_dev_tools import IntelligentQoLDevTool
 from tools.intelligent_tool_manager import IntelligentMCPToolManager
 from tools.project_analysis import ProjectAnalysisTools
+from tools.security_hardening import HardeningTool
 from utils.security import SecurityManager
 
 
@@ -111,9 +124,93 @@ class ProgressNotification(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+def _loads_message(line: Union[str, bytes]) -> Any:
+    """Parse one JSON-RPC message, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _dumps_message(message: Any) -> bytes:
+    """Serialize one JSON-RPC message as a newline-terminated UTF-8 line."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson is stricter about key and integer types; fall back to stdlib
+            pass
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+
+def _validate_request_shape(request_data: Any) -> Optional[str]:
+    """Cheap structural check mirroring MCPRequest; returns a problem description or None.
+
+    MCPRequest stays the documented schema, but building a pydantic model for every
+    incoming message is needless overhead on the request path.
+    """
+    if not isinstance(request_data, dict):
+        return "request must be a JSON object"
+    if not isinstance(request_data.get("method"), str):
+        return "'method' must be a string"
+    params = request_data.get("params")
+    if params is not None and not isinstance(params, dict):
+        return "'params' must be an object"
+    request_id = request_data.get("id")
+    if request_id is not None and not isinstance(request_id, (str, int)):
+        return "'id' must be a string or integer"
+    return None
+
+
 class KotlinMCPServerV2:
     """Enhanced MCP Server implementation with modern features."""
 
+    # Methods whose params must carry a non-empty key: method -> (key, error message)
+    _REQUIRED_PARAMS: Dict[str, Tuple[str, str]] = {
+        "tools/call": ("name", "Missing tool name"),
+        "call_tool": ("name", "Missing tool name"),
+        "resources/read": ("uri", "Missing resource URI"),
+        "prompts/get": ("name", "Missing prompt name"),
+    }
+
+    # Tools routed to a dedicated handler(arguments, operation_id) method: tool -> method name.
+    # Resolved with getattr on each call so per-instance overrides are honoured.
+    _TOOL_HANDLERS: Dict[str, str] = {
+        "refactorFunction": "handle_refactor_function",
+        "applyCodeAction": "handle_apply_code_action",
+        "optimizeImports": "handle_optimize_imports",
+        "formatCode": "handle_format_code",
+        "androidGenerateComposeUI": "handle_android_generate_compose_ui",
+        "androidSetupArchitecture": "handle_android_setup_architecture",
+        "androidSetupDataLayer": "handle_android_setup_data_layer",
+        "androidSetupNetwork": "handle_android_setup_network",
+        "securityEncryptData": "handle_security_encrypt_data",
+        "securityDecryptData": "handle_security_decrypt_data",
+        "privacyRequestErasure": "handle_privacy_request_erasure",
+        "privacyExportData": "handle_privacy_export_data",
+        "securityAuditTrail": "handle_security_audit_trail",
+        "fileBackup": "handle_file_backup",
+        "fileRestore": "handle_file_restore",
+        "fileSyncWatch": "handle_file_sync_watch",
+        "fileClassifySensitivity": "handle_file_classify_sensitivity",
+        "securityHardening": "handle_security_hardening",
+        "gitStatus": "handle_git_status",
+        "gitSmartCommit": "handle_git_smart_commit",
+        "gitCreateFeatureBranch": "handle_git_create_feature_branch",
+        "gitMergeWithResolution": "handle_git_merge_with_resolution",
+        "apiCallSecure": "handle_api_call_secure",
+        "apiMonitorMetrics": "handle_api_monitor_metrics",
+        "apiValidateCompliance": "handle_api_validate_compliance",
+        "projectSearch": "handle_project_search",
+        "todoListFromCode": "handle_todo_list_from_code",
+        "readmeGenerateOrUpdate": "handle_readme_generate_or_update",
+        "changelogSummarize": "handle_changelog_summarize",
+        "buildAndTest": "handle_build_and_test",
+        "dependencyAudit": "handle_dependency_audit",
+    }
+
+    # Tools always delegated to the intelligent tool manager
+    _MANAGED_TOOLS = frozenset({"analyzeCodeQuality", "generateTests", "applyPatch"})
+
     def __init__(self, name: str = "kotlin-mcp-server", project_path: Optional[str] = None):
         """Initialize the enhanced MCP server."""
         self.name = name
@@ -142,6 +239,8 @@ class KotlinMCPServerV2:
             )
 
         self.allowed_roots: List[Path] = [self.project_path]
+        self._resolved_roots: Tuple[Path, ...] = ()
+        self._resolved_roots_key: Tuple[Path, ...] = ()
         self.logger.info(f"Using project path: {self.project_path}")
 
         # Initialize all tool modules immediately
@@ -152,6 +251,28 @@ class KotlinMCPServerV2:
             str(self.project_path), self.security_manager
         )
 
+        # Upper bound on concurrently executing tool calls (MCP_MAX_CONCURRENT_TOOLS)
+        self._tool_semaphore = asyncio.Semaphore(max(1, Config.get_int("MCP_MAX_CONCURRENT_TOOLS")))
+
+        # Per-project tool instances reused across calls, keyed by tool class
+        self._tool_cache: Dict[type, Any] = {}
+
+        # JSON-RPC method -> handler(params) jump table used by handle_request
+        self._method_dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {
+            "initialize": self.handle_initialize,
+            "ping": self._rpc_ping,
+            "tools/list": self._rpc_list_tools,
+            "list_tools": self._rpc_list_tools,
+            "tools/call": self._rpc_call_tool,
+            "call_tool": self._rpc_call_tool,
+            "resources/list": self._rpc_list_resources,
+            "resources/read": self._rpc_read_resource,
+            "roots/list": self._rpc_list_roots,
+            "prompts/list": self._rpc_list_prompts,
+            "prompts/get": self._rpc_get_prompt,
+            "logging/setLevel": self._rpc_set_level,
+        }
+
     def setup_logging(self) -> None:
         """Configure structured logging."""
         logging.basicConfig(
@@ -181,6 +302,7 @@ class KotlinMCPServerV2:
             self.intelligent_tool_manager = IntelligentMCPToolManager(
                 str(self.project_path), self.security_manager
             )
+            self._tool_cache.clear()
             self.logger.info(f"Re-initialized tools with project path: {self.project_path}")
 
     async def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -1342,194 +1464,122 @@ class KotlinMCPServerV2:
 
         operation_id = str(uuid.uuid4())
 
-        try:
-            self.log_message(f"Starting tool: {name} (ID: {operation_id})", level="info")
-
-            # Track operation
-            self.active_operations[operation_id] = {
-                "tool": name,
-                "start_time": datetime.now(),
-                "progress": 0,
-            }
-
-            # Send initial progress
-            await self.send_progress(operation_id, 0, f"Starting {name}")
-
-            # Route to appropriate tool handler with validation
-            if name == "refactorFunction":
-                # Map to existing create_kotlin_file or intelligent refactoring
-                result = await self.handle_refactor_function(arguments, operation_id)
-            elif name == "applyCodeAction":
-                result = await self.handle_apply_code_action(arguments, operation_id)
-            elif name == "optimizeImports":
-                result = await self.handle_optimize_imports(arguments, operation_id)
-            elif name == "formatCode":
-                result = await self.handle_format_code(arguments, operation_id)
-            elif name == "analyzeCodeQuality":
-                # Delegate to intelligent tool manager
-                if self.intelligent_tool_manager:
-                    await self.send_progress(
-                        operation_id, 30, f"Executing {name} via intelligent tool manager"
-                    )
-                    result = await self.intelligent_tool_manager.execute_intelligent_tool(
-                        name, arguments
-                    )
-                    await self.send_progress(operation_id, 100, f"Completed {name}")
-                else:
-                    result = {
-                        "content": [{"type": "text", "text": "Tool not available"}],
-                        "isError": True,
-                    }
-            elif name == "generateTests":
-                # Delegate to intelligent tool manager
-                if self.intelligent_tool_manager:
-                    await self.send_progress(
-                        operation_id, 30, f"Executing {name} via intelligent tool manager"
-                    )
-                    result = await self.intelligent_tool_manager.execute_intelligent_tool(
-                        name, arguments
-                    )
-                    await self.send_progress(operation_id, 100, f"Completed {name}")
-                else:
-                    result = {
-                        "content": [{"type": "text", "text": "Tool not available"}],
-                        "isError": True,
-                    }
-            elif name == "applyPatch":
-                # Delegate to intelligent tool manager
-                if self.intelligent_tool_manager:
-                    await self.send_progress(
-                        operation_id, 30, f"Executing {name} via intelligent tool manager"
-                    )
-                    result = await self.intelligent_tool_manager.execute_intelligent_tool(
-                        name, arguments
-                    )
-                    await self.send_progress(operation_id, 100, f"Completed {name}")
-                else:
-                    result = {
-                        "content": [{"type": "text", "text": "Tool not available"}],
-                        "isError": True,
-                    }
-            elif name == "androidGenerateComposeUI":
-                result = await self.handle_android_generate_compose_ui(arguments, operation_id)
-            elif name == "androidSetupArchitecture":
-                result = await self.handle_android_setup_architecture(arguments, operation_id)
-            elif name == "androidSetupDataLayer":
-                result = await self.handle_android_setup_data_layer(arguments, operation_id)
-            elif name == "androidSetupNetwork":
-                result = await self.handle_android_setup_network(arguments, operation_id)
-            elif name == "securityEncryptData":
-                result = await self.handle_security_encrypt_data(arguments, operation_id)
-            elif name == "securityDecryptData":
-                result = await self.handle_security_decrypt_data(arguments, operation_id)
-            elif name == "privacyRequestErasure":
-                result = await self.handle_privacy_request_erasure(arguments, operation_id)
-            elif name == "privacyExportData":
-                result = await self.handle_privacy_export_data(arguments, operation_id)
-            elif name == "securityAuditTrail":
-                result = await self.handle_security_audit_trail(arguments, operation_id)
-            elif name == "fileBackup":
-                result = await self.handle_file_backup(arguments, operation_id)
-            elif name == "fileRestore":
-                result = await self.handle_file_restore(arguments, operation_id)
-            elif name == "fileSyncWatch":
-                result = await self.handle_file_sync_watch(arguments, operation_id)
-            elif name == "fileClassifySensitivity":
-                result = await self.handle_file_classify_sensitivity(arguments, operation_id)
-            elif name == "securityHardening":
-                result = await self.handle_security_hardening(arguments, operation_id)
-            elif name == "gitStatus":
-                result = await self.handle_git_status(arguments, operation_id)
-            elif name == "gitSmartCommit":
-                result = await self.handle_git_smart_commit(arguments, operation_id)
-            elif name == "gitCreateFeatureBranch":
-                result = await self.handle_git_create_feature_branch(arguments, operation_id)
-            elif name == "gitMergeWithResolution":
-                result = await self.handle_git_merge_with_resolution(arguments, operation_id)
-            elif name == "apiCallSecure":
-                result = await self.handle_api_call_secure(arguments, operation_id)
-            elif name == "apiMonitorMetrics":
-                result = await self.handle_api_monitor_metrics(arguments, operation_id)
-            elif name == "apiValidateCompliance":
-                result = await self.handle_api_validate_compliance(arguments, operation_id)
-            elif name == "projectSearch":
-                result = await self.handle_project_search(arguments, operation_id)
-            elif name == "todoListFromCode":
-                result = await self.handle_todo_list_from_code(arguments, operation_id)
-            elif name == "readmeGenerateOrUpdate":
-                result = await self.handle_readme_generate_or_update(arguments, operation_id)
-            elif name == "changelogSummarize":
-                result = await self.handle_changelog_summarize(arguments, operation_id)
-            elif name == "buildAndTest":
-                result = await self.handle_build_and_test(arguments, operation_id)
-            elif name == "dependencyAudit":
-                result = await self.handle_dependency_audit(arguments, operation_id)
-            # Let other tools fall through to intelligent manager
-            # elif name == "setupRetrofitApi":
-            #     result = await self.handle_setup_retrofit_api(arguments, operation_id)
-            # elif name == "implementGdprCompliance":
-            #     result = await self.handle_implement_gdpr_compliance(arguments, operation_id)
-            # elif name == "implementHipaaCompliance":
-            #     result = await self.handle_implement_hipaa_compliance(arguments, operation_id)
-            # elif name == "setupSecureStorage":
-            #     result = await self.handle_setup_secure_storage(arguments, operation_id)
-            # elif name == "queryLlm":
-            #     result = await self.handle_query_llm(arguments, operation_id)
-            # elif name == "analyzeCodeWithAi":
-            #     result = await self.handle_analyze_code_quality(arguments, operation_id)
-            # elif name == "generateCodeWithAi":
-            #     result = await self.handle_generate_code_with_ai(arguments, operation_id)
-            # elif name == "generateUnitTests":
-            #     result = await self.handle_generate_tests(arguments, operation_id)
-            # elif name == "setupUiTesting":
-            #     result = await self.handle_setup_ui_testing(arguments, operation_id)
-            # elif name == "manageProjectFiles":
-            #     result = await self.handle_manage_project_files(arguments, operation_id)
-            # elif name == "setupCloudSync":
-            #     result = await self.handle_setup_cloud_sync(arguments, operation_id)
-            # elif name == "setupExternalApi":
-            #     result = await self.handle_setup_external_api(arguments, operation_id)
-            # elif name == "callExternalApi":
-            #     result = await self.handle_call_external_api(arguments, operation_id)
-            else:
-                # All other tools are handled by the intelligent tool manager
-                # This ensures proper MCP protocol communication while using intelligent capabilities
-                if self.intelligent_tool_manager:
-                    await self.send_progress(
-                        operation_id, 30, f"Executing {name} via intelligent tool manager"
-                    )
-
-                    # Use intelligent tool manager but ensure MCP protocol compliance
-                    try:
+        # Cap concurrent tool executions so active_operations stays bounded under load
+        async with self._tool_semaphore:
+            try:
+                self.log_message(f"Starting tool: {name} (ID: {operation_id})", level="info")
+
+                # Track operation
+                self.active_operations[operation_id] = {
+                    "tool": name,
+                    "start_time": datetime.now(),
+                    "progress": 0,
+                }
+
+                # Send initial progress
+                await self.send_progress(operation_id, 0, f"Starting {name}")
+
+                # Route to appropriate tool handler with validation
+                handler_name = self._TOOL_HANDLERS.get(name)
+                if handler_name is not None:
+                    result = await getattr(self, handler_name)(arguments, operation_id)
+                elif name in self._MANAGED_TOOLS:
+                    # Delegate to intelligent tool manager
+                    if self.intelligent_tool_manager:
+                        await self.send_progress(
+                            operation_id, 30, f"Executing {name} via intelligent tool manager"
+                        )
                         result = await self.intelligent_tool_manager.execute_intelligent_tool(
                             name, arguments
                         )
-
-                        # Ensure the result is in proper MCP format
-                        if isinstance(result, dict) and "content" in result:
-                            # Already in MCP format
-                            mcp_result = result
-                        else:
-                            # Convert to MCP format
-                            mcp_result = {
-                                "content": [{"type": "text", "text": json.dumps(result, indent=2)}]
-                            }
-
                         await self.send_progress(operation_id, 100, f"Completed {name}")
+                    else:
+                        result = {
+                            "content": [{"type": "text", "text": "Tool not available"}],
+                            "isError": True,
+                        }
+                # Let other tools fall through to intelligent manager
+                # elif name == "setupRetrofitApi":
+                #     result = await self.handle_setup_retrofit_api(arguments, operation_id)
+                # elif name == "implementGdprCompliance":
+                #     result = await self.handle_implement_gdpr_compliance(arguments, operation_id)
+                # elif name == "implementHipaaCompliance":
+                #     result = await self.handle_implement_hipaa_compliance(arguments, operation_id)
+                # elif name == "setupSecureStorage":
+                #     result = await self.handle_setup_secure_storage(arguments, operation_id)
+                # elif name == "queryLlm":
+                #     result = await self.handle_query_llm(arguments, operation_id)
+                # elif name == "analyzeCodeWithAi":
+                #     result = await self.handle_analyze_code_quality(arguments, operation_id)
+                # elif name == "generateCodeWithAi":
+                #     result = await self.handle_generate_code_with_ai(arguments, operation_id)
+                # elif name == "generateUnitTests":
+                #     result = await self.handle_generate_tests(arguments, operation_id)
+                # elif name == "setupUiTesting":
+                #     result = await self.handle_setup_ui_testing(arguments, operation_id)
+                # elif name == "manageProjectFiles":
+                #     result = await self.handle_manage_project_files(arguments, operation_id)
+                # elif name == "setupCloudSync":
+                #     result = await self.handle_setup_cloud_sync(arguments, operation_id)
+                # elif name == "setupExternalApi":
+                #     result = await self.handle_setup_external_api(arguments, operation_id)
+                # elif name == "callExternalApi":
+                #     result = await self.handle_call_external_api(arguments, operation_id)
+                else:
+                    # All other tools are handled by the intelligent tool manager
+                    # This ensures proper MCP protocol communication while using intelligent capabilities
+                    if self.intelligent_tool_manager:
+                        await self.send_progress(
+                            operation_id, 30, f"Executing {name} via intelligent tool manager"
+                        )
 
-                        # Clean up operation tracking
-                        del self.active_operations[operation_id]
+                        # Use intelligent tool manager but ensure MCP protocol compliance
+                        try:
+                            result = await self.intelligent_tool_manager.execute_intelligent_tool(
+                                name, arguments
+                            )
+
+                            # Ensure the result is in proper MCP format
+                            if isinstance(result, dict) and "content" in result:
+                                # Already in MCP format
+                                mcp_result = result
+                            else:
+                                # Convert to MCP format
+                                mcp_result = {
+                                    "content": [
+                                        {"type": "text", "text": json.dumps(result, indent=2)}
+                                    ]
+                                }
 
-                        self.log_message(
-                            f"Completed tool: {name} (ID: {operation_id})", level="info"
-                        )
+                            await self.send_progress(operation_id, 100, f"Completed {name}")
 
-                        return mcp_result
+                            self.log_message(
+                                f"Completed tool: {name} (ID: {operation_id})", level="info"
+                            )
 
-                    except Exception as e:
-                        self.log_message(
-                            f"Intelligent tool manager error for {name}: {e}", level="error"
-                        )
+                            return mcp_result
+
+                        except Exception as e:
+                            self.log_message(
+                                f"Intelligent tool manager error for {name}: {e}", level="error"
+                            )
+                            return {
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": json.dumps(
+                                            {
+                                                "success": False,
+                                                "error": f"Tool execution failed: {str(e)}",
+                                                "tool_name": name,
+                                            },
+                                            indent=2,
+                                        ),
+                                    }
+                                ],
+                                "isError": True,
+                            }
+                    else:
                         return {
                             "content": [
                                 {
@@ -1537,7 +1587,7 @@ class KotlinMCPServerV2:
                                     "text": json.dumps(
                                         {
                                             "success": False,
-                                            "error": f"Tool execution failed: {str(e)}",
+                                            "error": "Intelligent tool manager not available",
                                             "tool_name": name,
                                         },
                                         indent=2,
@@ -1546,49 +1596,29 @@ class KotlinMCPServerV2:
                             ],
                             "isError": True,
                         }
-                else:
-                    return {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(
-                                    {
-                                        "success": False,
-                                        "error": "Intelligent tool manager not available",
-                                        "tool_name": name,
-                                    },
-                                    indent=2,
-                                ),
-                            }
-                        ],
-                        "isError": True,
-                    }
-
-            # Send completion progress
-            await self.send_progress(operation_id, 100, f"Completed {name}")
 
-            # Clean up operation tracking
-            del self.active_operations[operation_id]
+                # Send completion progress
+                await self.send_progress(operation_id, 100, f"Completed {name}")
 
-            self.log_message(f"Completed tool: {name} (ID: {operation_id})", level="info")
+                self.log_message(f"Completed tool: {name} (ID: {operation_id})", level="info")
 
-            return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+                return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
 
-        except ValidationError as e:
-            self.log_message(f"Validation error in {name}: {e}", level="error")
-            return {
-                "content": [{"type": "text", "text": f"Validation error: {e}"}],
-                "isError": True,
-            }
-        except Exception as e:
-            self.log_message(f"Error executing {name}: {e}", level="error")
-            # Clean up operation tracking
-            if operation_id in self.active_operations:
-                del self.active_operations[operation_id]
-            return {
-                "content": [{"type": "text", "text": f"Error executing tool: {e}"}],
-                "isError": True,
-            }
+            except ValidationError as e:
+                self.log_message(f"Validation error in {name}: {e}", level="error")
+                return {
+                    "content": [{"type": "text", "text": f"Validation error: {e}"}],
+                    "isError": True,
+                }
+            except Exception as e:
+                self.log_message(f"Error executing {name}: {e}", level="error")
+                return {
+                    "content": [{"type": "text", "text": f"Error executing tool: {e}"}],
+                    "isError": True,
+                }
+            finally:
+                # Clean up operation tracking on every exit path
+                self.active_operations.pop(operation_id, None)
 
     async def handle_list_resources(self) -> Dict[str, Any]:
         """List available project resources."""
@@ -1876,6 +1906,27 @@ Please generate the complete Room database setup with all components.
             "content_preview": content[:200] + "..." if len(content) > 200 else content,
         }
 
+    def _get_tool(self, tool_cls: type, *args: Any) -> Any:
+        """Return the cached tool instance for the current project, creating it on first use.
+
+        Tools default to ``tool_cls(project_path, security_manager)``; pass ``args`` for
+        tools with a different constructor signature.
+        """
+        tool = self._tool_cache.get(tool_cls)
+        if tool is None:
+            if not args:
+                args = (str(self.project_path), self.security_manager)
+            tool = tool_cls(*args)
+            self._tool_cache[tool_cls] = tool
+        return tool
+
+    async def _run_core(
+        self, tool_cls: type, operation_id: str, progress_message: str, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Report progress, then run the cached tool's core functionality with payload."""
+        await self.send_progress(operation_id, 30, progress_message)
+        return await self._get_tool(tool_cls)._execute_core_functionality(None, payload)
+
     # New tool handlers using sidecar and new tools
     async def handle_refactor_function(
         self, arguments: Dict[str, Any], operation_id: str
@@ -1979,73 +2030,51 @@ Please generate the complete Room database setup with all components.
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle gitStatus tool."""
-        from tools.intelligent_build_tools import IntelligentGitTool
-
-        await self.send_progress(operation_id, 30, "Checking Git status")
-
-        git_tool = IntelligentGitTool(str(self.project_path), self.security_manager)
-        result = await git_tool._execute_core_functionality(None, {"operation": "status"})
-
-        return result
+        return await self._run_core(
+            IntelligentGitTool, operation_id, "Checking Git status", {"operation": "status"}
+        )
 
     async def handle_git_smart_commit(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle gitSmartCommit tool."""
-        from tools.intelligent_build_tools import IntelligentGitTool
-
-        await self.send_progress(operation_id, 30, "Creating smart commit")
-
-        git_tool = IntelligentGitTool(str(self.project_path), self.security_manager)
-        result = await git_tool._execute_core_functionality(None, {"operation": "smart_commit"})
-
-        return result
+        return await self._run_core(
+            IntelligentGitTool, operation_id, "Creating smart commit", {"operation": "smart_commit"}
+        )
 
     async def handle_git_create_feature_branch(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle gitCreateFeatureBranch tool."""
-        from tools.intelligent_build_tools import IntelligentGitTool
-
-        await self.send_progress(operation_id, 30, "Creating feature branch")
-
-        git_tool = IntelligentGitTool(str(self.project_path), self.security_manager)
-        result = await git_tool._execute_core_functionality(
-            None, {"operation": "create_feature_branch", "branch_name": arguments.get("branchName")}
+        return await self._run_core(
+            IntelligentGitTool,
+            operation_id,
+            "Creating feature branch",
+            {"operation": "create_feature_branch", "branch_name": arguments.get("branchName")},
         )
 
-        return result
-
     async def handle_git_merge_with_resolution(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle gitMergeWithResolution tool."""
-        from tools.intelligent_build_tools import IntelligentGitTool
-
-        await self.send_progress(operation_id, 30, "Attempting merge with resolution")
-
-        git_tool = IntelligentGitTool(str(self.project_path), self.security_manager)
-        result = await git_tool._execute_core_functionality(
-            None,
+        return await self._run_core(
+            IntelligentGitTool,
+            operation_id,
+            "Attempting merge with resolution",
             {
                 "operation": "merge_with_resolution",
                 "target_branch": arguments.get("targetBranch", "main"),
             },
         )
 
-        return result
-
     async def handle_api_call_secure(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle apiCallSecure tool."""
-        from tools.intelligent_external_api_tools import IntelligentExternalAPITool
-
-        await self.send_progress(operation_id, 30, "Making secure API call")
-
-        api_tool = IntelligentExternalAPITool(str(self.project_path), self.security_manager)
-        result = await api_tool._execute_core_functionality(
-            None,
+        return await self._run_core(
+            IntelligentExternalAPITool,
+            operation_id,
+            "Making secure API call",
             {
                 "operation": "call",
                 "api_name": arguments.get("apiName"),
@@ -2057,19 +2086,14 @@ Please generate the complete Room database setup with all components.
             },
         )
 
-        return result
-
     async def handle_api_monitor_metrics(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle apiMonitorMetrics tool."""
-        from tools.intelligent_external_api_tools import IntelligentExternalAPITool
-
-        await self.send_progress(operation_id, 30, "Retrieving API metrics")
-
-        api_tool = IntelligentExternalAPITool(str(self.project_path), self.security_manager)
-        result = await api_tool._execute_core_functionality(
-            None,
+        return await self._run_core(
+            IntelligentExternalAPITool,
+            operation_id,
+            "Retrieving API metrics",
             {
                 "operation": "monitor",
                 "api_name": arguments.get("apiName"),
@@ -2077,19 +2101,14 @@ Please generate the complete Room database setup with all components.
             },
         )
 
-        return result
-
     async def handle_api_validate_compliance(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle apiValidateCompliance tool."""
-        from tools.intelligent_external_api_tools import IntelligentExternalAPITool
-
-        await self.send_progress(operation_id, 30, "Validating API compliance")
-
-        api_tool = IntelligentExternalAPITool(str(self.project_path), self.security_manager)
-        result = await api_tool._execute_core_functionality(
-            None,
+        return await self._run_core(
+            IntelligentExternalAPITool,
+            operation_id,
+            "Validating API compliance",
             {
                 "operation": "validate_compliance",
                 "api_name": arguments.get("apiName"),
@@ -2097,17 +2116,13 @@ Please generate the complete Room database setup with all components.
             },
         )
 
-        return result
-
     async def handle_security_hardening(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle securityHardening tool."""
-        from tools.security_hardening import HardeningTool
-
         await self.send_progress(operation_id, 30, "Executing security hardening operation")
 
-        hardening_tool = HardeningTool(str(self.project_path))
+        hardening_tool = self._get_tool(HardeningTool, str(self.project_path))
         result = await hardening_tool._execute_core_functionality(None, arguments)
 
         return result
@@ -2116,13 +2131,10 @@ Please generate the complete Room database setup with all components.
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle projectSearch tool."""
-        from tools.intelligent_qol_dev_tools import IntelligentQoLDevTool
-
-        await self.send_progress(operation_id, 30, "Searching project")
-
-        qol_tool = IntelligentQoLDevTool(str(self.project_path), self.security_manager)
-        result = await qol_tool._execute_core_functionality(
-            None,
+        return await self._run_core(
+            IntelligentQoLDevTool,
+            operation_id,
+            "Searching project",
             {
                 "operation": "search",
                 "query": arguments.get("query"),
@@ -2132,19 +2144,14 @@ Please generate the complete Room database setup with all components.
             },
         )
 
-        return result
-
     async def handle_todo_list_from_code(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle todoListFromCode tool."""
-        from tools.intelligent_qol_dev_tools import IntelligentQoLDevTool
-
-        await self.send_progress(operation_id, 30, "Extracting TODOs from code")
-
-        qol_tool = IntelligentQoLDevTool(str(self.project_path), self.security_manager)
-        result = await qol_tool._execute_core_functionality(
-            None,
+        return await self._run_core(
+            IntelligentQoLDevTool,
+            operation_id,
+            "Extracting TODOs from code",
             {
                 "operation": "todo_list",
                 "include_pattern": arguments.get("includePattern", "*.{kt,java,py,js,ts}"),
@@ -2152,38 +2159,28 @@ Please generate the complete Room database setup with all components.
             },
         )
 
-        return result
-
     async def handle_readme_generate_or_update(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle readmeGenerateOrUpdate tool."""
-        from tools.intelligent_qol_dev_tools import IntelligentQoLDevTool
-
-        await self.send_progress(operation_id, 30, "Generating/updating README")
-
-        qol_tool = IntelligentQoLDevTool(str(self.project_path), self.security_manager)
-        result = await qol_tool._execute_core_functionality(
-            None,
+        return await self._run_core(
+            IntelligentQoLDevTool,
+            operation_id,
+            "Generating/updating README",
             {
                 "operation": "readme_update",
                 "force_regenerate": arguments.get("forceRegenerate", False),
             },
         )
 
-        return result
-
     async def handle_changelog_summarize(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle changelogSummarize tool."""
-        from tools.intelligent_qol_dev_tools import IntelligentQoLDevTool
-
-        await self.send_progress(operation_id, 30, "Summarizing changelog")
-
-        qol_tool = IntelligentQoLDevTool(str(self.project_path), self.security_manager)
-        result = await qol_tool._execute_core_functionality(
-            None,
+        return await self._run_core(
+            IntelligentQoLDevTool,
+            operation_id,
+            "Summarizing changelog",
             {
                 "operation": "changelog_summarize",
                 "changelog_path": arguments.get("changelogPath", "CHANGELOG.md"),
@@ -2191,18 +2188,14 @@ Please generate the complete Room database setup with all components.
             },
         )
 
-        return result
-
     async def handle_build_and_test(
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle buildAndTest tool."""
-        from tools.build_and_test_tool import BuildAndTestTool
-
         await self.send_progress(operation_id, 30, "Building and testing")
 
         # Use new project root enforcing tool
-        build_tool = BuildAndTestTool(self.security_manager)
+        build_tool = self._get_tool(BuildAndTestTool, self.security_manager)
         result = await build_tool.build_and_test(arguments)
 
         return result
@@ -2211,14 +2204,12 @@ Please generate the complete Room database setup with all components.
         self, arguments: Dict[str, Any], operation_id: str
     ) -> Dict[str, Any]:
         """Handle dependencyAudit tool."""
-        from tools.intelligent_qol_dev_tools import IntelligentQoLDevTool
-
-        await self.send_progress(operation_id, 30, "Auditing dependencies")
-
-        qol_tool = IntelligentQoLDevTool(str(self.project_path), self.security_manager)
-        result = await qol_tool._execute_core_functionality(None, {"operation": "dependency_audit"})
-
-        return result
+        return await self._run_core(
+            IntelligentQoLDevTool,
+            operation_id,
+            "Auditing dependencies",
+            {"operation": "dependency_audit"},
+        )
 
     # All tool handling now delegated to intelligent tool manager
 
@@ -2385,20 +2376,31 @@ Please generate the complete Room database setup with all components.
         }
 
     # Utility methods
+    def _resolved_allowed_roots(self) -> Tuple[Path, ...]:
+        """Return allowed_roots resolved, recomputing only when the list has changed."""
+        key = tuple(self.allowed_roots)
+        if key != self._resolved_roots_key:
+            resolved = []
+            for root in key:
+                try:
+                    resolved.append(root.resolve())
+                except (OSError, ValueError):
+                    continue
+            self._resolved_roots = tuple(resolved)
+            self._resolved_roots_key = key
+        return self._resolved_roots
+
     def is_path_allowed(self, path: Path) -> bool:
         """Check if a path is within allowed roots."""
         try:
             resolved_path = path.resolve()
-            # Compatibility: use try_relative_to for older Python versions
-            for root in self.allowed_roots:
-                try:
-                    resolved_path.relative_to(root.resolve())
-                    return True
-                except ValueError:
-                    continue
-            return False
         except (OSError, ValueError):
             return False
+        # parents membership instead of is_relative_to keeps Python 3.8 compatibility
+        for root in self._resolved_allowed_roots():
+            if resolved_path == root or root in resolved_path.parents:
+                return True
+        return False
 
     def log_message(self, message: str, level: str = "info") -> None:
         """Log structured message."""
@@ -2411,8 +2413,10 @@ Please generate the complete Room database setup with all components.
             self.active_operations[operation_id]["progress"] = progress
 
         # For now, just log progress - in a full MCP implementation,
-        # this would send progress notifications via the protocol
-        self.log_message(f"Operation {operation_id}: {progress}% - {message}", level="debug")
+        # this would send progress notifications via the protocol.
+        # Progress is DEBUG-only, so skip building the record unless it will be emitted.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Operation %s: %s%% - %s", operation_id, progress, message)
 
     def create_error_response(
         self, code: int, message: str, request_id: Optional[Union[str, int]] = None
@@ -2420,65 +2424,62 @@ Please generate the complete Room database setup with all components.
         """Create standardized JSON-RPC error response."""
         return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
 
+    # JSON-RPC adapters: normalize every method to handler(params)
+    async def _rpc_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    async def _rpc_list_tools(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.handle_list_tools()
+
+    async def _rpc_call_tool(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.handle_call_tool(params["name"], params.get("arguments", {}))
+
+    async def _rpc_list_resources(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.handle_list_resources()
+
+    async def _rpc_read_resource(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.handle_read_resource(params["uri"])
+
+    async def _rpc_list_roots(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.handle_list_roots()
+
+    async def _rpc_list_prompts(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.handle_list_prompts()
+
+    async def _rpc_get_prompt(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.handle_get_prompt(params["name"], params.get("arguments", {}))
+
+    async def _rpc_set_level(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Handle VS Code logging level setting
+        level = params.get("level", "info")
+        self.logger.info(f"MCP client requested log level: {level}")
+        return {}
+
     async def handle_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming MCP request with enhanced error handling."""
 
+        request_id = request_data.get("id") if isinstance(request_data, dict) else None
+        problem = _validate_request_shape(request_data)
+        if problem:
+            if not isinstance(request_id, (str, int)):
+                request_id = None
+            return self.create_error_response(-32600, f"Invalid request: {problem}", request_id)
+
+        method = request_data["method"]
+        params = request_data.get("params") or {}
+
         try:
-            # Validate request structure
-            request = MCPRequest(**request_data)
-
-            method = request.method
-            params = request.params or {}
-            request_id = request.id
-
-            # Route to appropriate handler
-            if method == "initialize":
-                result = await self.handle_initialize(params)
-                return {"jsonrpc": "2.0", "id": request_id, "result": result}
-            elif method == "ping":
-                return {"jsonrpc": "2.0", "id": request_id, "result": {}}
-            elif method in ["tools/list", "list_tools"]:
-                result = await self.handle_list_tools()
-                return {"jsonrpc": "2.0", "id": request_id, "result": result}
-            elif method in ["tools/call", "call_tool"]:
-                tool_name = params.get("name")
-                tool_args = params.get("arguments", {})
-                if not tool_name:
-                    return self.create_error_response(-32602, "Missing tool name", request_id)
-                result = await self.handle_call_tool(tool_name, tool_args)
-                return {"jsonrpc": "2.0", "id": request_id, "result": result}
-            elif method == "resources/list":
-                result = await self.handle_list_resources()
-                return {"jsonrpc": "2.0", "id": request_id, "result": result}
-            elif method == "resources/read":
-                uri = params.get("uri")
-                if not uri:
-                    return self.create_error_response(-32602, "Missing resource URI", request_id)
-                result = await self.handle_read_resource(uri)
-                return {"jsonrpc": "2.0", "id": request_id, "result": result}
-            elif method == "roots/list":
-                result = await self.handle_list_roots()
-                return {"jsonrpc": "2.0", "id": request_id, "result": result}
-            elif method == "prompts/list":
-                result = await self.handle_list_prompts()
-                return {"jsonrpc": "2.0", "id": request_id, "result": result}
-            elif method == "prompts/get":
-                name = params.get("name")
-                arguments = params.get("arguments", {})
-                if not name:
-                    return self.create_error_response(-32602, "Missing prompt name", request_id)
-                result = await self.handle_get_prompt(name, arguments)
-                return {"jsonrpc": "2.0", "id": request_id, "result": result}
-            elif method == "logging/setLevel":
-                # Handle VS Code logging level setting
-                level = params.get("level", "info")
-                self.logger.info(f"MCP client requested log level: {level}")
-                # We can optionally adjust our logging level here
-                return {"jsonrpc": "2.0", "id": request_id, "result": {}}
-            else:
-                # Unknown method
+            handler = self._method_dispatch.get(method)
+            if handler is None:
                 return self.create_error_response(-32601, f"Unknown method: {method}", request_id)
 
+            required = self._REQUIRED_PARAMS.get(method)
+            if required and not params.get(required[0]):
+                return self.create_error_response(-32602, required[1], request_id)
+
+            result = await handler(params)
+            return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
         except ValidationError as e:
             return self.create_error_response(-32602, f"Invalid params: {e}", request_id)
         except Exception as e:
@@ -2540,34 +2541,42 @@ async def main() -> None:
 
     # Start the enhanced MCP communication loop
     async def mcp_loop() -> None:
+        # Bind per-message lookups once; this loop runs for every request
+        loop = asyncio.get_running_loop()
+        stdin_readline = sys.stdin.readline
+        stdout_write = sys.stdout.buffer.write
+        stdout_flush = sys.stdout.buffer.flush
+        loads = _loads_message
+        dumps = _dumps_message
+        handle_request = server.handle_request
+
+        def send(message: Dict[str, Any]) -> None:
+            stdout_write(dumps(message))
+            stdout_flush()
+
         while True:
             try:
                 # Use synchronous readline for compatibility
-                line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+                line = await loop.run_in_executor(None, stdin_readline)
                 if not line:
                     break  # EOF, client closed connection
 
                 # Parse request
-                request_data = json.loads(line.strip())
+                request_data = loads(line)
 
                 # Handle request with enhanced error handling
-                response = await server.handle_request(request_data)
+                response = await handle_request(request_data)
 
                 # Send response
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
+                send(response)
 
             except json.JSONDecodeError as e:
-                # Invalid JSON
-                error_response = server.create_error_response(-32700, "Parse error: Invalid JSON")
-                sys.stdout.write(json.dumps(error_response) + "\n")
-                sys.stdout.flush()
+                # Invalid JSON (orjson.JSONDecodeError subclasses this too)
+                send(server.create_error_response(-32700, "Parse error: Invalid JSON"))
             except Exception as e:
                 # Unexpected error
                 server.log_message(f"Unexpected error in main loop: {e}", level="error")
-                error_response = server.create_error_response(-32000, f"Internal error: {e}")
-                sys.stdout.write(json.dumps(error_response) + "\n")
-                sys.stdout.flush()
+                send(server.create_error_response(-32000, f"Internal error: {e}"))
 
     await mcp_loop()
 
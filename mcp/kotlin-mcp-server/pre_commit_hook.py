@@ -4,11 +4,152 @@ Pre-commit hook to ensure code quality before commits
 Automatically runs when code is committed to prevent breaking changes
 """
 
-import shlex
+import os
+import py_compile
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional, Tuple
+
+# Path fragments that exclude a file from the quick checks
+EXCLUDED_PATHS_RE = re.compile(r"__pycache__|\.git|\.venv|htmlcov|\.pytest_cache|archive")
+
+
+# In-process checks take (files, project_root) and return a failure summary or None.
+# Running them here avoids an interpreter cold start plus tool import per check.
+InProcessCheck = Callable[[List[str], Path], Optional[str]]
+
+
+def _check_syntax(files: List[str], project_root: Path) -> Optional[str]:
+    """Byte-compile each file, as ``python3 -m py_compile`` would"""
+    errors = []
+    for name in files:
+        try:
+            py_compile.compile(str(project_root / name), doraise=True)
+        except py_compile.PyCompileError as e:
+            errors.append(e.msg)
+    return "\n".join(errors) or None
+
+
+def _check_flake8_critical(files: List[str], project_root: Path) -> Optional[str]:
+    """Report syntax errors and undefined names via flake8's application API"""
+    from flake8.main.application import Application
+
+    app = Application()
+    # Single job: never fork a multiprocessing pool from inside a worker thread
+    app.run(
+        [
+            "--select=E9,F63,F7,F82",
+            "--jobs=1",
+            f"--output-file={os.devnull}",
+            *(str(project_root / name) for name in files),
+        ]
+    )
+    if app.result_count:
+        return f"{app.result_count} critical flake8 violation(s)"
+    return None
+
+
+def _check_isort(files: List[str], project_root: Path) -> Optional[str]:
+    """Compare each file with its isort-sorted form without printing diffs"""
+    import isort
+    from isort.exceptions import FileSkipped
+
+    # settings_path picks up pyproject.toml and first-party detection like the CLI does
+    config = isort.Config(settings_path=str(project_root), profile="black", line_length=100)
+    unsorted = []
+    for name in files:
+        path = project_root / name
+        source = path.read_text(encoding="utf-8")
+        try:
+            sorted_source = isort.code(source, config=config, file_path=path)
+        except FileSkipped:
+            # "# isort: skip_file" or a skipped directory; the CLI reports these as skipped
+            continue
+        if sorted_source != source:
+            unsorted.append(name)
+    if unsorted:
+        return "Imports are incorrectly sorted: " + ", ".join(unsorted)
+    return None
+
+
+def _check_black(files: List[str], project_root: Path) -> Optional[str]:
+    """Check formatting with black's library API, as ``black --check`` would"""
+    import black
+
+    mode = black.Mode(line_length=100)
+    unformatted = []
+    for name in files:
+        source = (project_root / name).read_text(encoding="utf-8")
+        try:
+            black.format_file_contents(source, fast=False, mode=mode)
+        except black.NothingChanged:
+            continue
+        except Exception as e:  # black raises various errors for unparsable sources
+            unformatted.append(f"{name} ({e})")
+            continue
+        unformatted.append(name)
+    if unformatted:
+        return "would reformat " + ", ".join(unformatted)
+    return None
+
+
+def _run_inprocess_check(
+    check: InProcessCheck, description: str, files: List[str], project_root: Path
+) -> Tuple[str, bool, str]:
+    """Run an in-process check and return (description, passed, report)"""
+    try:
+        problem = check(files, project_root)
+    except (ImportError, OSError, UnicodeDecodeError) as e:
+        return description, False, f"💥 {description} - ERROR: {e}"
+    except Exception as e:  # a tool failing on one file must not abort the whole hook
+        return description, False, f"💥 {description} - ERROR: {type(e).__name__}: {e}"
+
+    if problem is None:
+        return description, True, f"✅ {description} - PASSED"
+    return description, False, f"❌ {description} - FAILED\nError: {problem[:200]}"
+
+
+def _run_check(
+    command_list: List[str], description: str, project_root: Path
+) -> Tuple[str, bool, str]:
+    """Run a single check argv and return (description, passed, report)"""
+    try:
+        # Additional security: validate command executables
+        allowed_commands = ["python3", "python", "pytest", "black", "flake8", "isort", "bandit"]
+        if command_list[0] not in allowed_commands:
+            return (
+                description,
+                False,
+                f"❌ {description} - BLOCKED: Unauthorized command: {command_list[0]}",
+            )
+
+        # Use longer timeout for bandit security scan, shorter for others
+        timeout_val = 60 if "bandit" in command_list else 15
+
+        result = subprocess.run(
+            command_list,
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            timeout=timeout_val,
+            shell=False,  # Explicitly disable shell execution
+            check=False,  # Don't raise exception on non-zero exit
+        )
+
+        if result.returncode == 0:
+            return description, True, f"✅ {description} - PASSED"
+        report = f"❌ {description} - FAILED"
+        if result.stderr:
+            report += f"\nError: {result.stderr[:200]}"
+        return description, False, report
+
+    except subprocess.TimeoutExpired:
+        return description, False, f"⏰ {description} - TIMEOUT"
+    except (FileNotFoundError, PermissionError, subprocess.SubprocessError) as e:
+        return description, False, f"💥 {description} - ERROR: {e}"
 
 
 def run_quick_checks() -> bool:
@@ -18,111 +159,90 @@ def run_quick_checks() -> bool:
     failed_checks = []
     project_root = Path(__file__).parent
 
-    # Dynamically find all Python files in the project
-    python_files: List[Path] = []
-    for pattern in ["*.py", "**/*.py"]:
-        python_files.extend(project_root.glob(pattern))
-
-    # Filter out __pycache__, .venv, htmlcov and other unwanted directories
+    # Dynamically find all Python files in the project, skipping __pycache__, .venv,
+    # htmlcov and other unwanted directories (matched on the project-relative path)
     python_files_str = [
-        str(f.relative_to(project_root))
-        for f in python_files
-        if not any(
-            excluded in str(f)
-            for excluded in ["__pycache__", ".git", ".venv", "htmlcov", ".pytest_cache", "archive"]
-        )
+        rel
+        for rel in (str(f.relative_to(project_root)) for f in project_root.rglob("*.py"))
+        if not EXCLUDED_PATHS_RE.search(rel)
     ]
 
-    main_files = " ".join(python_files_str)
-
-    checks = [
-        # Python syntax check
-        (
-            f"python3 -m py_compile {main_files}",
-            "Python syntax validation",
-        ),
+    checks: List[Tuple[List[str], str]] = [
         # Import check for main modules
         (
-            'python3 -c "import kotlin_mcp_server; from ai.llm_integration import LLMIntegration; from utils.security import SecurityManager"',
+            [
+                "python3",
+                "-c",
+                "import kotlin_mcp_server; from ai.llm_integration import LLMIntegration; from utils.security import SecurityManager",
+            ],
             "Module import validation",
         ),
-        # Critical flake8 checks (syntax errors and undefined names)
-        (
-            f"python3 -m flake8 --select=E9,F63,F7,F82 {main_files}",
-            "Critical syntax errors",
-        ),
         # Basic security check with bandit
         # High-severity security issues
         (
-            f"python3 -m bandit -r {main_files} -lll",
+            ["python3", "-m", "bandit", "-lll", "-r", *python_files_str],
             "High-severity security issues",
         ),
-        # isort check for import sorting
-        (
-            f"python3 -m isort --check-only --profile=black --line-length=100 --skip-glob='*.venv*' {main_files}",
-            "Import sorting check",
-        ),
-        # Black check for code formatting
-        (
-            f"python3 -m black --check --line-length=100 --exclude='.venv|__pycache__|htmlcov' {main_files}",
-            "Code formatting check",
-        ),
         # Quick test run (only core functionality tests)
         (
-            "python3 -m pytest tests/test_server_core.py::TestKotlinMCPServerCore::test_server_initialization --tb=no -q",
+            [
+                "python3",
+                "-m",
+                "pytest",
+                "tests/test_server_core.py::TestKotlinMCPServerCore::test_server_initialization",
+                "--tb=no",
+                "-q",
+            ],
             "Core functionality test",
         ),
         # Tool modules import test
         (
-            "python3 -c 'from tools.gradle_tools import GradleTools; from tools.build_optimization import BuildOptimizationTools; from tools.project_analysis import ProjectAnalysisTools; print(\"Tool modules import successfully\")'",
+            [
+                "python3",
+                "-c",
+                'from tools.gradle_tools import GradleTools; from tools.build_optimization import BuildOptimizationTools; from tools.project_analysis import ProjectAnalysisTools; print("Tool modules import successfully")',
+            ],
             "Tool modules import test",
         ),
         # Tool modules integration test - basic functionality check
         (
-            "python3 -c 'from kotlin_mcp_server import KotlinMCPServerV2; server = KotlinMCPServerV2(); print(\"Tool integration test passed\")'",
+            [
+                "python3",
+                "-c",
+                'from kotlin_mcp_server import KotlinMCPServerV2; server = KotlinMCPServerV2(); print("Tool integration test passed")',
+            ],
             "Tool modules integration test",
         ),
     ]
 
-    for command, description in checks:
-        print(f"\n⚡ {description}...")
-        try:
-            # Use shlex.split for safer command execution
-            command_list = shlex.split(command)
-
-            # Additional security: validate command executables
-            allowed_commands = ["python3", "python", "pytest", "black", "flake8", "isort", "bandit"]
-            if command_list[0] not in allowed_commands:
-                print(f"❌ {description} - BLOCKED: Unauthorized command: {command_list[0]}")
-                failed_checks.append(description)
-                continue
-
-            # Use longer timeout for bandit security scan, shorter for others
-            timeout_val = 60 if "bandit" in command else 15
-
-            result = subprocess.run(
-                command_list,
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=timeout_val,
-                shell=False,  # Explicitly disable shell execution
-                check=False,  # Don't raise exception on non-zero exit
-            )
+    # Syntax, lint, import-order and formatting checks run in this interpreter
+    inprocess_checks: List[Tuple[InProcessCheck, str]] = [
+        (_check_syntax, "Python syntax validation"),
+        (_check_flake8_critical, "Critical syntax errors"),
+        (_check_isort, "Import sorting check"),
+        (_check_black, "Code formatting check"),
+    ]
 
-            if result.returncode == 0:
-                print(f"✅ {description} - PASSED")
-            else:
-                print(f"❌ {description} - FAILED")
-                if result.stderr:
-                    print(f"Error: {result.stderr[:200]}")
-                failed_checks.append(description)
+    # Checks only read the tree, so run them concurrently; subprocess workers just wait
+    # on their child. Results are reported in-process checks first, then subprocesses.
+    total = len(inprocess_checks) + len(checks)
+    with ThreadPoolExecutor(max_workers=min(total, os.cpu_count() or 4)) as executor:
+        futures = [
+            executor.submit(
+                _run_inprocess_check, check, description, python_files_str, project_root
+            )
+            for check, description in inprocess_checks
+        ]
+        futures += [
+            executor.submit(_run_check, command_list, description, project_root)
+            for command_list, description in checks
+        ]
+        results = [future.result() for future in futures]
 
-        except subprocess.TimeoutExpired:
-            print(f"⏰ {description} - TIMEOUT")
-            failed_checks.append(description)
-        except (FileNotFoundError, PermissionError, subprocess.SubprocessError) as e:
-            print(f"💥 {description} - ERROR: {e}")
+    for description, passed, report in results:
+        print(f"\n⚡ {description}...")
+        print(report)
+        if not passed:
             failed_checks.append(description)
 
     return len(failed_checks) == 0
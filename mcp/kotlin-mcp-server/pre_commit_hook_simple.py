@@ -4,10 +4,50 @@ Simplified Pre-commit hook for Kotlin MCP Server
 Focuses on essential quality checks for project files only
 """
 
+import json
 import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import List, Tuple
+
+# Check description for the fused isort/black/flake8 run in _inproc_checks.py
+INPROC_CHECKS_DESCRIPTION = "Formatters+linter"
+
+
+def _decode(output: bytes) -> str:
+    """Decode captured check output for display"""
+    return output.decode("utf-8", "replace")
+
+
+def _run_check(command: str, project_root: Path) -> "subprocess.CompletedProcess[bytes]":
+    """Run one check command from the project root"""
+    # Use shlex.split for safer command execution
+    command_list = shlex.split(command)
+
+    return subprocess.run(
+        command_list,
+        cwd=project_root,
+        stdin=subprocess.DEVNULL,
+        # Output is only read on failure, so keep bytes and decode lazily
+        capture_output=True,
+        timeout=20,
+        shell=False,
+        check=False,
+    )
+
+
+def _parse_inproc_results(
+    result: "subprocess.CompletedProcess[bytes]",
+) -> List[Tuple[str, int, str]]:
+    """Unpack the per-tool JSON summary printed by _inproc_checks.py"""
+    try:
+        summary = json.loads(result.stdout.strip().splitlines()[-1])
+        return [(name, code, output) for name, (code, output) in summary.items()]
+    except (IndexError, ValueError, TypeError):
+        # Helper crashed before printing its summary; report it as one failure
+        return [(INPROC_CHECKS_DESCRIPTION, result.returncode or 1, _decode(result.stderr))]
 
 
 def run_essential_checks() -> bool:
@@ -19,65 +59,53 @@ def run_essential_checks() -> bool:
 
     # Essential checks that should always pass
     checks = [
-        # Python syntax check for main modules
-        (
-            "python3 -c 'import kotlin_mcp_server; from ai.llm_integration import LLMIntegration; from utils.security import SecurityManager; print(\"✅ Core modules import successfully\")'",
-            "Core module imports",
-        ),
-        # Import sorting check (current directory)
+        # Core and tool module imports, fused into one interpreter start-up
         (
-            "python3 -m isort --check-only --profile=black --line-length=100 --skip=.venv .",
-            "Import sorting check",
+            "python3 -c 'import kotlin_mcp_server; from ai.llm_integration import LLMIntegration; from utils.security import SecurityManager; from tools.gradle_tools import GradleTools; from tools.build_optimization import BuildOptimizationTools; from tools.project_analysis import ProjectAnalysisTools; print(\"✅ Core and tool modules import successfully\")'",
+            "Module imports",
         ),
-        # Code formatting check (current directory)
+        # isort, black and flake8 (current directory) in a single interpreter;
+        # reported per tool from the helper's JSON summary
         (
-            "python3 -m black --check --line-length=100 --exclude='.venv|__pycache__|htmlcov' .",
-            "Code formatting check",
-        ),
-        # Basic flake8 check (current directory)
-        (
-            "python3 -m flake8 --max-line-length=100 --extend-ignore=E203,W503,E501,C901 --exclude=__pycache__,.venv,htmlcov .",
-            "Code linting check",
-        ),
-        # Tool modules import test
-        (
-            "python3 -c 'from tools.gradle_tools import GradleTools; from tools.build_optimization import BuildOptimizationTools; from tools.project_analysis import ProjectAnalysisTools; print(\"✅ Tool modules import successfully\")'",
-            "Tool modules import test",
+            "python3 _inproc_checks.py",
+            INPROC_CHECKS_DESCRIPTION,
         ),
     ]
 
-    for command, description in checks:
-        print(f"\n⚡ {description}...")
-        try:
-            # Use shlex.split for safer command execution
-            command_list = shlex.split(command)
-
-            result = subprocess.run(
-                command_list,
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=20,
-                shell=False,
-                check=False,
-            )
-
-            if result.returncode == 0:
-                print(f"✅ {description} - PASSED")
-            else:
-                print(f"❌ {description} - FAILED")
-                if result.stderr and len(result.stderr) < 500:
-                    print(f"Error: {result.stderr}")
-                elif result.stdout and len(result.stdout) < 500:
-                    print(f"Output: {result.stdout}")
-                failed_checks.append(description)
+    # The checks are independent, so run them concurrently; results are printed from
+    # this thread as each one finishes, so output never interleaves.
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {
+            executor.submit(_run_check, command, project_root): description
+            for command, description in checks
+        }
+        for future in as_completed(futures):
+            description = futures[future]
+            try:
+                result = future.result()
 
-        except subprocess.TimeoutExpired:
-            print(f"⏰ {description} - TIMEOUT")
-            failed_checks.append(description)
-        except (FileNotFoundError, PermissionError, subprocess.SubprocessError) as e:
-            print(f"💥 {description} - ERROR: {e}")
-            failed_checks.append(description)
+                if description == INPROC_CHECKS_DESCRIPTION:
+                    sub_results = _parse_inproc_results(result)
+                else:
+                    output = _decode(result.stderr or result.stdout) if result.returncode else ""
+                    sub_results = [(description, result.returncode, output)]
+
+                for sub_description, returncode, output in sub_results:
+                    print(f"\n⚡ {sub_description}...")
+                    if returncode == 0:
+                        print(f"✅ {sub_description} - PASSED")
+                    else:
+                        print(f"❌ {sub_description} - FAILED")
+                        if output and len(output) < 500:
+                            print(f"Error: {output}")
+                        failed_checks.append(sub_description)
+
+            except subprocess.TimeoutExpired:
+                print(f"\n⏰ {description} - TIMEOUT")
+                failed_checks.append(description)
+            except (FileNotFoundError, PermissionError, subprocess.SubprocessError) as e:
+                print(f"\n💥 {description} - ERROR: {e}")
+                failed_checks.append(description)
 
     return len(failed_checks) == 0
 
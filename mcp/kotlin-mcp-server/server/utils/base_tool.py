@@ -3,11 +3,33 @@ Base class for MCP tools with project root enforcement.
 """
 
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from server.utils.no_cwd_guard import assert_not_server_cwd
 from server.utils.project_resolver import ProjectRootError, resolve_project_root
 
+# camelCase argument synonyms and the standard snake_case key they normalize to
+_CAMEL_TO_SNAKE = {
+    "projectRoot": "project_root",
+    "filePath": "file_path",
+    "buildTool": "build_tool",
+    "skipTests": "skip_tests",
+    "maxFindings": "max_findings",
+}
+
+
+@lru_cache(maxsize=32)
+def _absolute_root(project_root: str) -> str:
+    """Normalize an absolute project root; every path a tool checks reuses the same root"""
+    return os.path.normpath(project_root)
+
+
+@lru_cache(maxsize=32)
+def _real_root(abs_project_root: str) -> str:
+    """Resolve symlinks in a project root once; every checked path is compared against it"""
+    return os.path.realpath(abs_project_root)
+
 
 class BaseMCPTool:
     """Base class for all MCP tools with project root enforcement."""
@@ -57,23 +79,33 @@ class BaseMCPTool:
         Raises:
             ValueError: If path is outside project root
         """
-        if os.path.isabs(file_path):
-            abs_path = file_path
-        else:
-            abs_path = os.path.join(project_root, file_path)
-
-        abs_path = os.path.abspath(abs_path)
-        abs_project_root = os.path.abspath(project_root)
-
-        # Check if path is under project root
+        abs_path = os.path.abspath(
+            file_path if os.path.isabs(file_path) else os.path.join(project_root, file_path)
+        )
+        # Relative roots depend on the working directory, so only absolute ones are cached
+        abs_project_root = (
+            _absolute_root(project_root)
+            if os.path.isabs(project_root)
+            else os.path.abspath(project_root)
+        )
+
+        # Check if path is under project root. commonpath raises ValueError on Windows
+        # when the paths are on different drives, which also means "outside".
         try:
-            os.path.relpath(abs_path, abs_project_root)
+            if os.path.commonpath([abs_path, abs_project_root]) != abs_project_root:
+                raise ValueError("not under project root")
         except ValueError as exc:
-            # Happens on Windows when paths are on different drives
             raise ValueError(f"Path {file_path} is outside project root {project_root}") from exc
 
-        if not abs_path.startswith(abs_project_root + os.sep) and abs_path != abs_project_root:
-            raise ValueError(f"Path {file_path} is outside project root {project_root}")
+        # The check above is lexical, so a symlink anywhere under the root (the target
+        # itself or any directory on the way to it) could still lead outside. realpath
+        # resolves every component, including the existing part of a path not created yet.
+        real_root = _real_root(abs_project_root)
+        try:
+            if os.path.commonpath([os.path.realpath(abs_path), real_root]) != real_root:
+                raise ValueError("link target not under project root")
+        except ValueError as exc:
+            raise ValueError(f"Path {file_path} links outside project root {project_root}") from exc
 
         return abs_path
 
@@ -87,27 +119,13 @@ class BaseMCPTool:
         Returns:
             Normalized arguments with standard keys
         """
-        # Standard normalization for common parameters
         normalized = dict(arguments)
+        # Most calls already use snake_case keys; one set check skips the alias walk
+        if _CAMEL_TO_SNAKE.keys().isdisjoint(normalized):
+            return normalized
 
-        # Project root
-        if "project_root" not in normalized and "projectRoot" in normalized:
-            normalized["project_root"] = normalized.pop("projectRoot")
-
-        # File path
-        if "file_path" not in normalized and "filePath" in normalized:
-            normalized["file_path"] = normalized.pop("filePath")
-
-        # Build tool
-        if "build_tool" not in normalized and "buildTool" in normalized:
-            normalized["build_tool"] = normalized.pop("buildTool")
-
-        # Skip tests
-        if "skip_tests" not in normalized and "skipTests" in normalized:
-            normalized["skip_tests"] = normalized.pop("skipTests")
-
-        # Max findings
-        if "max_findings" not in normalized and "maxFindings" in normalized:
-            normalized["max_findings"] = normalized.pop("maxFindings")
+        for camel, snake in _CAMEL_TO_SNAKE.items():
+            if camel in normalized and snake not in normalized:
+                normalized[snake] = normalized.pop(camel)
 
         return normalized
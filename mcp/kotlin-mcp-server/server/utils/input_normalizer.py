@@ -4,6 +4,9 @@ Input normalization utilities for handling camelCase/snake_case synonyms.
 
 from typing import Any
 
+# Values treated as "not provided"; built once rather than on every call
+_EMPTY_VALUES = (None, "", [], {})
+
 
 def norm(d: dict, *names: str, default: Any = None, required: bool = False) -> Any:
     """
@@ -22,7 +25,7 @@ def norm(d: dict, *names: str, default: Any = None, required: bool = False) -> A
         ValueError: If required=True and no value found
     """
     for n in names:
-        if n in d and d[n] not in (None, "", [], {}):
+        if n in d and d[n] not in _EMPTY_VALUES:
             return d[n]
     if required:
         raise ValueError(f"{'/'.join(names)} is required")
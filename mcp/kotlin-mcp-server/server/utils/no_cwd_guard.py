@@ -18,7 +18,8 @@ def assert_not_server_cwd(path: str) -> None:
     Raises:
         RuntimeError: If path equals server CWD
     """
-    if os.path.abspath(path) == SERVER_CWD:
+    # Resolved project roots are already absolute, so try a plain string compare first
+    if path == SERVER_CWD or os.path.abspath(path) == SERVER_CWD:
         raise RuntimeError(
             "ServerCwdMisuse: tool attempted to operate in server CWD. "
             "Resolve project_root and use that instead."
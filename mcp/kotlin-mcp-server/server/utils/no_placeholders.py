@@ -5,34 +5,127 @@ Guards against placeholder content in tool responses to ensure
 all outputs are production-ready.
 """
 
-import json
-from typing import Any, Dict, List, Union
-
-BAD_FRAGMENTS = {
-    "setup_room_database",
-    "setup_retrofit_api",
-    "intelligent_refactoring_suggestions",
-    "symbol_navigation_index",
-    "security_tools_variations",
-    "analyze_and_refactor_project",
-    "demo output",
-    "example output",
-    "placeholder",
-    "not implemented",
-    "coming soon",
-    "under construction",
-    "lorem ipsum",
-    "sample data",
-    "test data",
-    "mock response",
-    "dummy content",
-    "fake data",
-    "todo:",
-    "tbd:",
-    "fixme:",
-    "hack:",
-    "notimplementederror",
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+try:
+    import ahocorasick
+
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+BAD_FRAGMENTS = frozenset(
+    {
+        "setup_room_database",
+        "setup_retrofit_api",
+        "intelligent_refactoring_suggestions",
+        "symbol_navigation_index",
+        "security_tools_variations",
+        "analyze_and_refactor_project",
+        "demo output",
+        "example output",
+        "placeholder",
+        "not implemented",
+        "coming soon",
+        "under construction",
+        "lorem ipsum",
+        "sample data",
+        "test data",
+        "mock response",
+        "dummy content",
+        "fake data",
+        "todo:",
+        "tbd:",
+        "fixme:",
+        "hack:",
+        "notimplementederror",
+    }
+)
+
+# Fallback scan order: shortest fragments first, so common short markers such as
+# "todo:" are found before the long tool-name fragments are tried
+_BAD_ORDERED = tuple(sorted(BAD_FRAGMENTS, key=lambda fragment: (len(fragment), fragment)))
+
+# With pyahocorasick, the fragments are compiled into one automaton at import time so
+# each string is scanned in a single pass instead of once per fragment.
+if HAS_AHOCORASICK:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _fragment in BAD_FRAGMENTS:
+        _AUTOMATON.add_word(_fragment.lower(), _fragment)
+    _AUTOMATON.make_automaton()
+
+
+def _find_fragment(text: str) -> Optional[str]:
+    """Return the first bad fragment found in text, or None"""
+    # Lowering once is cheap next to the scan itself, and lets both paths use fast
+    # case-sensitive matching (a re.IGNORECASE alternation is many times slower)
+    lowered = text.lower()
+    if HAS_AHOCORASICK:
+        for _, fragment in _AUTOMATON.iter(lowered):
+            return fragment
+        return None
+
+    for fragment in _BAD_ORDERED:
+        if fragment in lowered:
+            return fragment
+    return None
+
+
+# Simple replacements for common placeholders
+_PLACEHOLDER_REPLACEMENTS = {
+    "TODO": "",
+    "TBD": "",
+    "placeholder": "content",
+    "demo output": "output",
+    "example output": "output",
+    "lorem ipsum": "text content",
+    "sample data": "data",
+    "test data": "data",
+    "mock response": "response",
+    "dummy content": "content",
+    "fake data": "data",
+}
+
+# Each placeholder is replaced as written, in Title case and in UPPER case
+_PLACEHOLDER_VARIANTS = {
+    variant(placeholder): variant(replacement)
+    for variant in (str, str.title, str.upper)
+    for placeholder, replacement in _PLACEHOLDER_REPLACEMENTS.items()
 }
+_PLACEHOLDER_RE = re.compile(
+    "|".join(re.escape(variant) for variant in sorted(_PLACEHOLDER_VARIANTS, key=len, reverse=True))
+)
+
+
+def _iter_strings(root: Any) -> Iterator[str]:
+    """Yield every string in a JSON-like payload, including dict keys"""
+    # Walk with an explicit stack rather than recursive generators, which pay a
+    # generator frame per nesting level on deep analysis trees
+    stack = [root]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    # Containers already walked in this scan: shared sub-objects are scanned once
+    # and self-referencing payloads terminate
+    seen: Set[int] = set()
+    while stack:
+        obj = pop()
+        if isinstance(obj, str):
+            yield obj
+            continue
+        if isinstance(obj, (dict, list, tuple)):
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                yield str(key)
+                push(value)
+        elif isinstance(obj, (list, tuple)):
+            extend(obj)
+        elif obj is not None and not isinstance(obj, (bool, int, float)):
+            # Non-JSON values are checked by their string form
+            yield str(obj)
 
 
 def ensure_no_placeholders(payload: Union[Dict[str, Any], List[Any], str]) -> None:
@@ -48,19 +141,11 @@ def ensure_no_placeholders(payload: Union[Dict[str, Any], List[Any], str]) -> No
     if payload is None:
         return
 
-    # Convert to string for searching
-    if isinstance(payload, str):
-        search_text = payload.lower()
-    else:
-        try:
-            search_text = json.dumps(payload, ensure_ascii=False).lower()
-        except (TypeError, ValueError):
-            # If we can't serialize, convert to string
-            search_text = str(payload).lower()
-
-    # Check for bad fragments
-    for fragment in BAD_FRAGMENTS:
-        if fragment.lower() in search_text:
+    # Check each string leaf rather than a serialized copy of the whole payload,
+    # stopping at the first bad fragment
+    for text in _iter_strings(payload):
+        fragment = _find_fragment(text)
+        if fragment is not None:
             raise RuntimeError(f"PlaceholderOutput: found '{fragment}' in tool response")
 
 
@@ -77,20 +162,13 @@ def validate_tool_response(response: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         RuntimeError: If placeholder content is found
     """
+    # Scans every string in the response, "content" items included
     ensure_no_placeholders(response)
 
     # Additional validations
     if not isinstance(response, dict):
         raise RuntimeError("Tool response must be a dictionary")
 
-    if "content" in response:
-        content = response["content"]
-        if isinstance(content, list):
-            for item in content:
-                ensure_no_placeholders(item)
-        else:
-            ensure_no_placeholders(content)
-
     return response
 
 
@@ -107,28 +185,7 @@ def clean_placeholder_content(text: str) -> str:
     if not text:
         return text
 
-    # Simple replacements for common placeholders
-    replacements = {
-        "TODO": "",
-        "TBD": "",
-        "placeholder": "content",
-        "demo output": "output",
-        "example output": "output",
-        "lorem ipsum": "text content",
-        "sample data": "data",
-        "test data": "data",
-        "mock response": "response",
-        "dummy content": "content",
-        "fake data": "data",
-    }
-
-    cleaned = text
-    for placeholder, replacement in replacements.items():
-        cleaned = cleaned.replace(placeholder, replacement)
-        cleaned = cleaned.replace(placeholder.title(), replacement.title())
-        cleaned = cleaned.replace(placeholder.upper(), replacement.upper())
-
-    return cleaned.strip()
+    return _PLACEHOLDER_RE.sub(lambda m: _PLACEHOLDER_VARIANTS[m.group(0)], text).strip()
 
 
 def is_placeholder_response(response: Dict[str, Any]) -> bool:
@@ -4,13 +4,63 @@ Project and workspace resolution utilities.
 
 import os
 import shutil
+import stat
+import time
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
+# Seconds a confirmed project root is trusted before it is stat'ed again. Tools resolve
+# the same root on every call, so this skips repeated filesystem checks in a session.
+VALID_ROOT_TTL = 5.0
+
+# Files find_gradle_cmd looks for while walking up from a project root
+_GRADLE_PROBE_NAMES = frozenset(
+    {"gradlew", "gradlew.bat", "settings.gradle", "settings.gradle.kts"}
+)
+
+# Absolute project roots confirmed to be directories, mapped to when they were checked
+_valid_roots: Dict[str, float] = {}
+
 
 class ProjectRootError(Exception):
     """Raised when project root cannot be resolved or is invalid."""
 
 
+def _is_valid_root(path: str) -> bool:
+    """Check that path is a directory, trusting recent positive results"""
+    now = time.monotonic()
+    checked_at = _valid_roots.get(path)
+    if checked_at is not None and now - checked_at < VALID_ROOT_TTL:
+        return True
+
+    # Only successes are remembered, so a root created later is picked up at once
+    if os.path.isdir(path):
+        _valid_roots[path] = now
+        return True
+    _valid_roots.pop(path, None)
+    return False
+
+
+def clear_resolver_caches() -> None:
+    """Forget cached project root checks and Gradle lookups (e.g. between tests)."""
+    _valid_roots.clear()
+    _normalize_root.cache_clear()
+    _find_gradle_cmd_cached.cache_clear()
+    _system_gradle.cache_clear()
+
+
+@lru_cache(maxsize=128)
+def _normalize_root(path: str) -> str:
+    """Normalize an absolute root path; a session resolves the same few roots repeatedly"""
+    return os.path.normpath(path)
+
+
+@lru_cache(maxsize=None)
+def _system_gradle() -> Optional[str]:
+    """Locate gradle on PATH once per session"""
+    return shutil.which("gradle")
+
+
 def resolve_project_root(
     inp: dict, env: Optional[Dict[str, str]] = None, ide_meta: Optional[dict] = None
 ) -> str:
@@ -33,13 +83,14 @@ def resolve_project_root(
     Raises:
         ProjectRootError: If no valid project root found
     """
-    env_dict: Dict[str, str] = env or dict(os.environ)
+    # Look variables up in place rather than copying the whole environment per call
+    env_get = env.get if env else os.environ.get
 
     # 1) Explicit input
     pr = inp.get("project_root") or inp.get("projectRoot")
 
     # 2) Environment variables
-    pr = pr or env_dict.get("PROJECT_PATH") or env_dict.get("WORKSPACE_PATH")
+    pr = pr or env_get("PROJECT_PATH") or env_get("WORKSPACE_PATH")
 
     # 3) IDE metadata (MCP client may pass this in resource metadata)
     if not pr and ide_meta:
@@ -55,8 +106,9 @@ def resolve_project_root(
             "IDE workspace will be used if available."
         )
 
-    pr = os.path.abspath(pr)
-    if not (os.path.isdir(pr) and os.path.exists(pr)):
+    # Relative roots depend on the working directory, so only absolute ones are cached
+    pr = _normalize_root(pr) if os.path.isabs(pr) else os.path.abspath(pr)
+    if not _is_valid_root(pr):
         raise ProjectRootError(f"ProjectRootInvalid: {pr} not found or not a directory")
 
     return pr
@@ -75,20 +127,44 @@ def find_gradle_cmd(project_root: str) -> Tuple[list, str, bool]:
     Raises:
         ProjectRootError: If no Gradle setup found
     """
-    # Search for wrapper upward from project_root
+    # Wrapper lookup walks every ancestor directory, so results are cached per root;
+    # callers get a fresh command list they are free to extend
+    cmd, working_dir, is_wrapper = _find_gradle_cmd_cached(project_root)
+    return list(cmd), working_dir, is_wrapper
+
+
+@lru_cache(maxsize=32)
+def _find_gradle_cmd_cached(project_root: str) -> Tuple[Tuple[str, ...], str, bool]:
+    """Uncached body of find_gradle_cmd; failed lookups raise and are not cached"""
+    # Search for wrapper upward from project_root, listing each directory once instead
+    # of stat'ing every candidate name separately
     cur = project_root
+    has_settings = False
     while True:
-        gw = os.path.join(cur, "gradlew")
-        gw_bat = os.path.join(cur, "gradlew.bat")
-
-        if os.path.isfile(gw) or os.path.isfile(gw_bat):
-            if os.path.isfile(gw):
-                try:
-                    os.chmod(gw, 0o755)
-                except OSError:
-                    pass
-                return ["./gradlew"], cur, True
-            return ["gradlew.bat"], cur, True
+        try:
+            with os.scandir(cur) as entries:
+                found = {
+                    entry.name: entry
+                    for entry in entries
+                    if entry.name in _GRADLE_PROBE_NAMES and entry.is_file()
+                }
+        except OSError:
+            found = {}
+
+        if "gradlew" in found:
+            # Only touch the wrapper's mode when it is not already executable; an
+            # unconditional chmod rewrites inode metadata on every lookup
+            try:
+                if not found["gradlew"].stat().st_mode & stat.S_IXUSR:
+                    os.chmod(found["gradlew"].path, 0o755)
+            except OSError:
+                pass
+            return ("./gradlew",), cur, True
+        if "gradlew.bat" in found:
+            return ("gradlew.bat",), cur, True
+
+        if cur == project_root:
+            has_settings = "settings.gradle" in found or "settings.gradle.kts" in found
 
         parent = os.path.dirname(cur)
         if parent == cur:
@@ -96,9 +172,7 @@ def find_gradle_cmd(project_root: str) -> Tuple[list, str, bool]:
         cur = parent
 
     # No wrapper—fallback if settings present and system gradle exists
-    settings = ("settings.gradle", "settings.gradle.kts")
-    if any(os.path.exists(os.path.join(project_root, s)) for s in settings):
-        if shutil.which("gradle"):
-            return ["gradle"], project_root, False
+    if has_settings and _system_gradle():
+        return ("gradle",), project_root, False
 
     raise ProjectRootError("GradleNotFound: no gradle wrapper and no system gradle on PATH")
@@ -3,27 +3,54 @@
 Shared test configuration and fixtures for all test modules
 """
 
-import tempfile
 from pathlib import Path
+from typing import Any, List, Tuple
 
 import pytest
 
 from kotlin_mcp_server import KotlinMCPServer
 
 
+def assert_tool_result(result: Any) -> None:
+    """Check the MCP tool-result envelope: a dict whose "content" is a list"""
+    assert isinstance(result, dict), f"tool result is {type(result).__name__}, not dict"
+    assert isinstance(result.get("content"), list), f"tool result content: {result!r:.200}"
+
+
 @pytest.fixture(scope="session")
-def temp_project_dir():
+def temp_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a temporary project directory for testing"""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    # Cleanup handled by tempfile
+    # pytest prunes old base temp directories, so nothing is left behind
+    return tmp_path_factory.mktemp("kotlin_mcp")
+
+
+@pytest.fixture(scope="session")
+def server_template() -> Tuple[KotlinMCPServer, List[Path]]:
+    """Create one server for the whole session; construction is the expensive part.
+
+    The server's initial allowed roots are snapshotted alongside it so each test can
+    start from them instead of inheriting every earlier test's project directory.
+    """
+    template = KotlinMCPServer("test-server")
+    return template, list(template.allowed_roots)
+
+
+@pytest.fixture
+def server(server_template: Tuple[KotlinMCPServer, List[Path]], tmp_path: Path) -> KotlinMCPServer:
+    """Shared server pointed at a fresh project directory for each test"""
+    template, initial_roots = server_template
+    template.allowed_roots[:] = initial_roots
+    template.set_project_path(str(tmp_path))
+    template.active_operations.clear()
+    template._tool_cache.clear()
+    return template
 
 
 @pytest.fixture
-def server_instance():
+def server_instance(tmp_path: Path):
     """Create a fresh server instance for each test"""
     server = KotlinMCPServer("test-server")
-    server.set_project_path(tempfile.mkdtemp())
+    server.set_project_path(str(tmp_path))
     return server
 
 
@@ -4,45 +4,43 @@ Test Suite for API and External Service Tools
 Tests external API calls and integration tools
 """
 
-import tempfile
+from pathlib import Path
 
 import pytest
 
 from kotlin_mcp_server import KotlinMCPServer
+from tests.conftest import assert_tool_result
 
 
 class TestAPITools:
     """Test suite for API and external service tools"""
 
     @pytest.fixture
-    def server(self) -> "KotlinMCPServer":
+    def server(self, tmp_path: Path) -> "KotlinMCPServer":
         """Create server instance for testing"""
         server = KotlinMCPServer("test-server")
-        server.set_project_path(tempfile.mkdtemp())
+        server.set_project_path(str(tmp_path))
         return server
 
-    @pytest.mark.asyncio
     async def test_call_external_api(self, server: KotlinMCPServer) -> None:
         """Test external API call tool"""
-        result = await server.handle_call_tool(
-            "call_external_api", {"api_name": "TestAPI", "method": "GET", "endpoint": "/test"}
+        assert_tool_result(
+            await server.handle_call_tool(
+                "call_external_api", {"api_name": "TestAPI", "method": "GET", "endpoint": "/test"}
+            )
         )
-        assert "content" in result
-        assert isinstance(result["content"], list)
 
-    @pytest.mark.asyncio
     async def test_setup_ui_testing(self, server: KotlinMCPServer) -> None:
         """Test UI testing setup"""
-        result = await server.handle_call_tool(
-            "setup_ui_testing", {"test_framework": "espresso", "include_page_objects": True}
+        assert_tool_result(
+            await server.handle_call_tool(
+                "setup_ui_testing", {"test_framework": "espresso", "include_page_objects": True}
+            )
         )
-        assert "content" in result
-        assert isinstance(result["content"], list)
 
-    @pytest.mark.asyncio
-    async def test_api_tools_variations(self, server: KotlinMCPServer) -> None:
-        """Test API tools with various configurations"""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "tool_name,args",
+        [
             ("call_external_api", {"api_name": "UserAPI", "method": "POST", "endpoint": "/users"}),
             (
                 "call_external_api",
@@ -54,14 +52,14 @@ class TestAPITools:
             ),
             ("setup_ui_testing", {"test_framework": "androidx", "include_page_objects": False}),
             ("setup_ui_testing", {"test_framework": "robolectric", "include_page_objects": True}),
-        ]
-
-        for tool_name, args in test_cases:
-            result = await server.handle_call_tool(tool_name, args)
-            assert "content" in result
-            assert isinstance(result["content"], list)
+        ],
+    )
+    async def test_api_tools_variations(
+        self, server: KotlinMCPServer, tool_name: str, args: dict
+    ) -> None:
+        """Test API tools with various configurations"""
+        assert_tool_result(await server.handle_call_tool(tool_name, args))
 
-    @pytest.mark.asyncio
     async def test_api_edge_cases(self, server: KotlinMCPServer) -> None:
         """Test API tools with edge cases"""
         # Test with empty endpoint
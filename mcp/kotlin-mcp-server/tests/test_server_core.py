@@ -4,7 +4,7 @@ Test Suite for Core Kotlin MCP Server functionality
 Tests the main server initialization, tool routing, and core features
 """
 
-import tempfile
+import inspect
 from pathlib import Path
 from typing import Any, Dict, cast
 
@@ -18,17 +18,16 @@ class TestKotlinMCPServerCore:
     """Test suite for core Kotlin MCP Server functionality"""
 
     @pytest.fixture
-    def server(self) -> "KotlinMCPServer":
+    def server(self, tmp_path: Path) -> "KotlinMCPServer":
         """Create server instance for testing"""
         server = KotlinMCPServer("test-server")
-        server.set_project_path(tempfile.mkdtemp())
+        server.set_project_path(str(tmp_path))
         return server
 
     # ============================================================================
     # CORE V2.0 ARCHITECTURE TESTS
     # ============================================================================
 
-    @pytest.mark.asyncio
     async def test_server_initialization(self, server: KotlinMCPServer) -> None:
         """Test server initializes with correct name and modules"""
         assert server.name == "test-server"
@@ -39,7 +38,6 @@ class TestKotlinMCPServerCore:
         assert hasattr(server, "llm_integration")
         assert hasattr(server, "kotlin_generator")
 
-    @pytest.mark.asyncio
     async def test_list_tools(self, server: KotlinMCPServer) -> None:
         """Test that handle_list_tools returns all tool definitions"""
         # Test the actual list_tools method that covers lines 84-758
@@ -116,11 +114,12 @@ class TestKotlinMCPServerCore:
         if result["content"]:
             assert "text" in result["content"][0]
 
-    @pytest.mark.asyncio
-    async def test_project_path_management(self, server: KotlinMCPServer) -> None:
+    async def test_project_path_management(
+        self, server: KotlinMCPServer, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
         """Test project path setting and validation"""
         # Test setting valid path
-        test_path = Path(tempfile.mkdtemp())
+        test_path = tmp_path_factory.mktemp("project")
         server.set_project_path(str(test_path))
         assert server.project_path == test_path
 
@@ -128,7 +127,6 @@ class TestKotlinMCPServerCore:
         server.set_project_path(str(test_path))
         assert server.project_path == test_path
 
-    @pytest.mark.asyncio
     async def test_handle_call_tool_routing(self, server: KotlinMCPServer) -> None:
         """Test that handle_call_tool properly routes to correct modules"""
         # Test routing to different modules
@@ -137,7 +135,12 @@ class TestKotlinMCPServerCore:
         )
         assert "content" in result
 
-    @pytest.mark.asyncio
+    def test_tool_handler_table_resolves(self, server: KotlinMCPServer) -> None:
+        """Test that every routed tool names an existing coroutine handler"""
+        for tool_name, handler_name in server._TOOL_HANDLERS.items():
+            handler = getattr(server, handler_name, None)
+            assert inspect.iscoroutinefunction(handler), f"{tool_name} -> {handler_name}"
+
     async def test_invalid_tool_handling(self, server: KotlinMCPServer) -> None:
         """Test handling of invalid tool names"""
         result = await server.handle_call_tool("invalid_tool_name", {})
@@ -146,19 +149,16 @@ class TestKotlinMCPServerCore:
         assert len(result["content"]) > 0
         assert "Unknown tool" in result["content"][0]["text"]
 
-    @pytest.mark.asyncio
     async def test_empty_arguments_handling(self, server: KotlinMCPServer) -> None:
         """Test handling of empty arguments"""
         result = await server.handle_call_tool("create_kotlin_class", {})
         assert "content" in result
 
-    @pytest.mark.asyncio
     async def test_none_arguments_handling(self, server: KotlinMCPServer) -> None:
         """Test handling of None arguments"""
         result = await server.handle_call_tool("create_kotlin_class", {})
         assert "content" in result
 
-    @pytest.mark.asyncio
     async def test_all_27_tools_systematically(self, server: KotlinMCPServer) -> None:
         """Test all 27 tools systematically with valid arguments"""
         all_tools_with_args = [
@@ -244,3 +244,80 @@ class TestKotlinMCPServerCore:
             assert isinstance(
                 result["content"], list
             ), f"Tool {tool_name} returned invalid content format"
+
+    async def test_handle_request_dispatch(self, server: KotlinMCPServer) -> None:
+        """Test JSON-RPC method routing through the dispatch table"""
+        response = await server.handle_request({"jsonrpc": "2.0", "id": 1, "method": "ping"})
+        assert response == {"jsonrpc": "2.0", "id": 1, "result": {}}
+
+        response = await server.handle_request({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        assert response["id"] == 2
+        assert "tools" in response["result"]
+
+        response = await server.handle_request({"jsonrpc": "2.0", "id": 3, "method": "bogus"})
+        assert response["error"]["code"] == -32601
+
+        response = await server.handle_request(
+            {"jsonrpc": "2.0", "id": 4, "method": "tools/call", "params": {}}
+        )
+        assert response["error"] == {"code": -32602, "message": "Missing tool name"}
+
+    async def test_tool_instances_cached_per_project(
+        self, server: KotlinMCPServer, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """Test tool instances are reused until the project path changes"""
+        from tools.intelligent_qol_dev_tools import IntelligentQoLDevTool
+
+        first = server._get_tool(IntelligentQoLDevTool)
+        assert server._get_tool(IntelligentQoLDevTool) is first
+
+        server.set_project_path(str(tmp_path_factory.mktemp("project")))
+        second = server._get_tool(IntelligentQoLDevTool)
+        assert second is not first
+        assert second.project_path == server.project_path
+
+    async def test_handle_request_rejects_malformed_envelope(self, server: KotlinMCPServer) -> None:
+        """Test malformed JSON-RPC envelopes get an Invalid Request error"""
+        response = await server.handle_request({"jsonrpc": "2.0", "id": 7})
+        assert response["id"] == 7
+        assert response["error"]["code"] == -32600
+
+        response = await server.handle_request(
+            {"jsonrpc": "2.0", "id": 8, "method": "ping", "params": ["not", "a", "dict"]}
+        )
+        assert response["error"]["code"] == -32600
+
+    def test_message_framing_round_trip(self) -> None:
+        """Test JSON-RPC messages serialize to one newline-terminated line and back"""
+        from kotlin_mcp_server import _dumps_message, _loads_message
+
+        message = {"jsonrpc": "2.0", "id": 1, "result": {"text": "héllo", "n": [1, 2]}}
+        line = _dumps_message(message)
+        assert line.endswith(b"\n")
+        assert line.count(b"\n") == 1
+        assert _loads_message(line) == message
+        assert _loads_message(line.decode("utf-8")) == message
+
+    def test_is_path_allowed_tracks_root_changes(
+        self, server: KotlinMCPServer, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """Test path checks use the current allowed roots"""
+        first_root = server.project_path
+        assert server.is_path_allowed(first_root / "app" / "build.gradle")
+        assert server.is_path_allowed(first_root)
+
+        other = tmp_path_factory.mktemp("other")
+        assert not server.is_path_allowed(other / "file.kt")
+
+        server.set_project_path(str(other))
+        assert server.is_path_allowed(other / "file.kt")
+        assert server.is_path_allowed(first_root / "app" / "build.gradle")
+        assert not server.is_path_allowed(Path("/etc/passwd"))
+
+    async def test_active_operations_cleared_after_tool_calls(
+        self, server: KotlinMCPServer
+    ) -> None:
+        """Test operation tracking is released on success and failure paths"""
+        await server.handle_call_tool("androidSetupNetwork", {})
+        await server.handle_call_tool("invalid_tool_name", {})
+        assert server.active_operations == {}
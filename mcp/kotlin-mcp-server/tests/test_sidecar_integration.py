@@ -5,7 +5,6 @@ Tests the Python-Kotlin sidecar communication and tool execution
 """
 
 import json
-import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -18,10 +17,10 @@ class TestSidecarIntegration:
     """Test suite for Kotlin sidecar integration"""
 
     @pytest.fixture
-    def server(self) -> "KotlinMCPServer":
+    def server(self, tmp_path: Path) -> "KotlinMCPServer":
         """Create server instance for testing"""
         server = KotlinMCPServer("test-server")
-        server.set_project_path(tempfile.mkdtemp())
+        server.set_project_path(str(tmp_path))
         return server
 
     @pytest.fixture
@@ -45,7 +44,6 @@ class TestClass {
         )
         return kotlin_file
 
-    @pytest.mark.asyncio
     async def test_refactor_function_rename(
         self, server: KotlinMCPServer, sample_kotlin_file: Path
     ) -> None:
@@ -86,7 +84,6 @@ class TestClass {
             # Verify the result structure
             assert result == mock_result
 
-    @pytest.mark.asyncio
     async def test_format_code_ktlint(
         self, server: KotlinMCPServer, sample_kotlin_file: Path
     ) -> None:
@@ -115,7 +112,6 @@ class TestClass {
             # Verify the result structure
             assert result == mock_result
 
-    @pytest.mark.asyncio
     async def test_optimize_imports(
         self, server: KotlinMCPServer, sample_kotlin_file: Path
     ) -> None:
@@ -154,7 +150,6 @@ class TestClass {
             # Verify the result structure
             assert result == mock_result
 
-    @pytest.mark.asyncio
     async def test_sidecar_error_handling(
         self, server: KotlinMCPServer, sample_kotlin_file: Path
     ) -> None:
@@ -175,7 +170,6 @@ class TestClass {
                     "test-op-4",
                 )
 
-    @pytest.mark.asyncio
     async def test_apply_code_action(
         self, server: KotlinMCPServer, sample_kotlin_file: Path
     ) -> None:
@@ -212,7 +206,6 @@ class TestClass {
             # Verify the result structure
             assert result == mock_result
 
-    @pytest.mark.asyncio
     async def test_sidecar_with_preview_mode(
         self, server: KotlinMCPServer, sample_kotlin_file: Path
     ) -> None:
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Tests for the VS Code HTTP bridge: pooled MCP worker processes and the HTTP front end
+"""
+
+import gzip
+import http.client
+import json
+import os
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import pytest
+
+import vscode_bridge
+from vscode_bridge import MCPBridgeHandler, MCPWorkerPool
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="stub server uses a shebang")
+
+# Answers tools/call requests one JSON line at a time, like the real server. Each reply
+# is preceded by a notification the bridge has to skip, and reports the stub's pid so
+# tests can tell whether a worker process was reused.
+STUB_SERVER = """\
+import json, os, sys, time
+
+sys.stderr.write("stub starting\\n")
+sys.stderr.flush()
+for line in sys.stdin:
+    if not line.strip():
+        continue
+    request = json.loads(line)
+    name = request["params"]["name"]
+    if name == "slow":
+        time.sleep(30)
+    if name == "crash":
+        sys.stderr.write("stub crashed\\n")
+        sys.stderr.flush()
+        sys.exit(2)
+    result = {
+        "tool": name,
+        "arguments": request["params"]["arguments"],
+        "pid": os.getpid(),
+        "project_path": os.environ["PROJECT_PATH"],
+    }
+    if name == "large":
+        result["padding"] = "x" * 4096
+    print(json.dumps({"jsonrpc": "2.0", "method": "notifications/progress"}))
+    print(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}), flush=True)
+"""
+
+
+@pytest.fixture
+def pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[MCPWorkerPool]:
+    """A fresh worker pool whose workers run the stub server"""
+    stub = tmp_path / "stub-mcp-server"
+    stub.write_text(f"#!{sys.executable}\n{STUB_SERVER}")
+    stub.chmod(0o755)
+
+    worker_pool = MCPWorkerPool(idle_timeout=300)
+    monkeypatch.setattr(vscode_bridge, "MCP_SERVER_COMMAND", str(stub))
+    monkeypatch.setattr(vscode_bridge, "TOOL_CALL_TIMEOUT", 1)
+    monkeypatch.setattr(vscode_bridge, "_WORKER_POOL", worker_pool)
+    yield worker_pool
+    worker_pool.close_idle()
+
+
+@pytest.fixture
+def bridge(pool: MCPWorkerPool) -> Iterator[Tuple[str, int]]:
+    """Serve the bridge on an ephemeral localhost port"""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), MCPBridgeHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[:2]
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+def _post(
+    address: Tuple[str, int], body: bytes, headers: Optional[Dict[str, str]] = None
+) -> Tuple[int, Dict[str, str], bytes]:
+    """POST body to the bridge and return the status, headers and raw response body"""
+    connection = http.client.HTTPConnection(*address, timeout=10)
+    try:
+        # http.client would otherwise send its own Accept-Encoding: identity
+        connection.putrequest("POST", "/", skip_accept_encoding=True)
+        if headers is None:
+            headers = {"Content-Length": str(len(body))}
+        for name, value in headers.items():
+            connection.putheader(name, value)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def _call(tmp_path: Path, tool: str, **arguments: Any) -> Dict[str, Any]:
+    """Run one tool call through the handler without going over HTTP"""
+    handler = MCPBridgeHandler.__new__(MCPBridgeHandler)
+    return handler.call_mcp_tool(tool, arguments, str(tmp_path))
+
+
+class TestMCPWorkerPool:
+    """Worker reuse and failure handling"""
+
+    def test_worker_is_reused_across_calls(self, pool: MCPWorkerPool, tmp_path: Path) -> None:
+        first = _call(tmp_path, "echo", n=1)
+        second = _call(tmp_path, "echo", n=2)
+
+        assert first["arguments"] == {"n": 1}
+        assert second["arguments"] == {"n": 2}
+        assert first["pid"] == second["pid"]
+        assert first["project_path"] == os.path.realpath(tmp_path)
+
+    def test_timeout_reports_error_and_discards_worker(
+        self, pool: MCPWorkerPool, tmp_path: Path
+    ) -> None:
+        before = _call(tmp_path, "echo")
+
+        assert _call(tmp_path, "slow") == {"error": "Command timeout"}
+
+        after = _call(tmp_path, "echo")
+        assert after["pid"] != before["pid"]
+
+    def test_worker_exit_reports_stderr_tail(self, pool: MCPWorkerPool, tmp_path: Path) -> None:
+        result = _call(tmp_path, "crash")
+
+        assert "stub crashed" in result["error"]
+        assert "pid" in _call(tmp_path, "echo")
+
+    def test_close_idle_stops_workers(self, pool: MCPWorkerPool, tmp_path: Path) -> None:
+        pid = _call(tmp_path, "echo")["pid"]
+        worker = pool.acquire(os.path.realpath(tmp_path))
+        pool.release(worker)
+
+        pool.close_idle()
+
+        assert not worker.alive
+        assert _call(tmp_path, "echo")["pid"] != pid
+
+    def test_invalid_tool_name_starts_no_worker(self, pool: MCPWorkerPool, tmp_path: Path) -> None:
+        assert _call(tmp_path, "echo; rm -rf /") == {"error": "Invalid tool name: echo; rm -rf /"}
+        assert not pool._idle
+
+
+class TestBridgeHTTP:
+    """Request handling over HTTP"""
+
+    def test_single_call(self, bridge: Tuple[str, int], tmp_path: Path) -> None:
+        body = json.dumps({"tool": "echo", "arguments": {"a": 1}, "project_path": str(tmp_path)})
+
+        status, _, raw = _post(bridge, body.encode())
+
+        assert status == 200
+        assert json.loads(raw)["result"]["arguments"] == {"a": 1}
+
+    def test_batch_continues_after_bad_entries(
+        self, bridge: Tuple[str, int], tmp_path: Path
+    ) -> None:
+        batch = [
+            {"tool": "echo", "arguments": {"n": 1}},
+            "not an object",
+            {"tool": "crash"},
+            {"tool": "bad name"},
+            {"tool": "echo", "arguments": {"n": 2}},
+        ]
+        body = json.dumps({"batch": batch, "project_path": str(tmp_path)})
+
+        status, _, raw = _post(bridge, body.encode())
+
+        assert status == 200
+        results = json.loads(raw)["results"]
+        assert len(results) == 5
+        assert results[0]["arguments"] == {"n": 1}
+        assert results[1] == {"error": "Invalid batch entry: expected an object"}
+        assert "stub crashed" in results[2]["error"]
+        assert results[3] == {"error": "Invalid tool name: bad name"}
+        assert results[4]["arguments"] == {"n": 2}
+
+    def test_batch_must_be_a_list(self, bridge: Tuple[str, int], tmp_path: Path) -> None:
+        body = json.dumps({"batch": {"tool": "echo"}, "project_path": str(tmp_path)})
+
+        status, _, raw = _post(bridge, body.encode())
+
+        assert status == 500
+        assert json.loads(raw) == {"error": "batch must be a list of tool calls"}
+
+    def test_missing_content_length_is_rejected(self, bridge: Tuple[str, int]) -> None:
+        status, headers, raw = _post(bridge, b"", headers={})
+
+        assert status == 411
+        assert headers["Connection"] == "close"
+        assert json.loads(raw) == {"error": "Content-Length required"}
+
+    def test_oversized_body_is_rejected(self, bridge: Tuple[str, int]) -> None:
+        too_long = str(vscode_bridge.MAX_REQUEST_BODY + 1)
+
+        status, headers, _ = _post(bridge, b"", headers={"Content-Length": too_long})
+
+        assert status == 413
+        assert headers["Connection"] == "close"
+
+    def test_large_response_is_gzipped_when_accepted(
+        self, bridge: Tuple[str, int], tmp_path: Path
+    ) -> None:
+        body = json.dumps({"tool": "large", "project_path": str(tmp_path)}).encode()
+
+        status, headers, raw = _post(
+            bridge,
+            body,
+            headers={"Content-Length": str(len(body)), "Accept-Encoding": "gzip"},
+        )
+
+        assert status == 200
+        assert headers["Content-Encoding"] == "gzip"
+        assert int(headers["Content-Length"]) == len(raw)
+        assert len(json.loads(gzip.decompress(raw))["result"]["padding"]) == 4096
+
+    def test_response_is_not_gzipped_unless_accepted(
+        self, bridge: Tuple[str, int], tmp_path: Path
+    ) -> None:
+        body = json.dumps({"tool": "large", "project_path": str(tmp_path)}).encode()
+
+        status, headers, raw = _post(bridge, body)
+
+        assert status == 200
+        assert "Content-Encoding" not in headers
+        assert len(json.loads(raw)["result"]["padding"]) == 4096
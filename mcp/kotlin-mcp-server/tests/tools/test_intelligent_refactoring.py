@@ -6,10 +6,9 @@ This module contains comprehensive tests for the Kotlin refactoring functionalit
 including rename, extract, inline, and introduce parameter refactorings.
 """
 
-import asyncio
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from typing import Any, Dict, Optional, Tuple
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -19,16 +18,8 @@ from tools.intelligent_refactoring import (
     UnifiedDiffGenerator,
 )
 
-
-class TestKotlinASTParser:
-    """Test cases for Kotlin AST parser."""
-
-    def setup_method(self):
-        self.parser = KotlinASTParser()
-
-    def test_parse_simple_class(self):
-        """Test parsing a simple Kotlin class."""
-        kotlin_code = """
+# Sources for the parser and diff tests, built once at import
+USER_CLASS_SOURCE = """
 class User {
     val name: String = ""
     var age: Int = 0
@@ -43,47 +34,198 @@ class User {
 }
 """.strip()
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kt", delete=False) as f:
-            f.write(kotlin_code)
-            temp_file = f.name
+CALCULATE_TOTAL_SOURCE = """
+fun calculateTotal(price: Double, tax: Double = 0.0): Double {
+    return price + (price * tax)
+}
+""".strip()
 
-        try:
-            symbols = self.parser.parse_file(temp_file)
+HELLO_SOURCE = 'fun hello() {\n    println("Hello")\n}'
+HELLO_WORLD_SOURCE = 'fun hello() {\n    println("Hello World")\n}'
 
-            assert "User" in symbols
-            assert symbols["User"]["type"] == "class"
-            assert "getDisplayName" in symbols
-            assert symbols["getDisplayName"]["type"] == "function"
-            assert "incrementAge" in symbols
-            assert "name" in symbols
-            assert symbols["name"]["type"] == "property"
-        finally:
-            Path(temp_file).unlink()
+# Kotlin sources the refactoring tests operate on, written once per session
+KOTLIN_SOURCES = {
+    "Calculator.kt": """
+class Calculator {
+    fun add(a: Int, b: Int): Int {
+        return a + b
+    }
 
-    def test_parse_function_with_parameters(self):
-        """Test parsing function with parameters."""
-        kotlin_code = """
-fun calculateTotal(price: Double, tax: Double = 0.0): Double {
-    return price + (price * tax)
+    fun calculate() {
+        val result = add(5, 3)
+        println(result)
+    }
+}
+""".strip(),
+    "Processor.kt": """
+fun processData() {
+    val data = listOf(1, 2, 3, 4, 5)
+    val filtered = data.filter { it > 2 }
+    val mapped = filtered.map { it * 2 }
+    println(mapped)
+}
+""".strip(),
+    "Message.kt": """
+fun getMessage(): String {
+    return "Hello World"
+}
+
+fun displayMessage() {
+    val message = getMessage()
+    println(message)
+}
+""".strip(),
+    "Greeter.kt": """
+fun greet(): String {
+    return "Hello User"
+}
+""".strip(),
+    "Invalid.kt": "fun test() { invalid_syntax }",
+}
+
+
+# What ktlint hands back after renaming add() to sum() in Calculator.kt
+RENAMED_CALCULATOR = """
+class Calculator {
+    fun sum(a: Int, b: Int): Int {
+        return a + b
+    }
+
+    fun calculate() {
+        val result = sum(5, 3)
+        println(result)
+    }
 }
 """.strip()
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kt", delete=False) as f:
-            f.write(kotlin_code)
-            temp_file = f.name
+# (file name, refactor arguments, formatted output or None for the unchanged source,
+#  whether Gradle compiles the result, text expected in the diff)
+REFACTOR_CASES = [
+    pytest.param(
+        "Calculator.kt",
+        {"functionName": "add", "refactorType": "rename", "newName": "sum"},
+        RENAMED_CALCULATOR,
+        True,
+        "sum",
+        id="rename",
+    ),
+    pytest.param(
+        "Processor.kt",
+        {
+            "functionName": "processData",
+            "refactorType": "extract",
+            "newName": "transformData",
+            "range": {"start": {"line": 2}, "end": {"line": 4}},
+        },
+        None,
+        True,
+        None,
+        id="extract",
+    ),
+    pytest.param(
+        "Message.kt",
+        {"functionName": "getMessage", "refactorType": "inline"},
+        None,
+        True,
+        None,
+        id="inline",
+    ),
+    pytest.param(
+        "Greeter.kt",
+        {
+            "functionName": "greet",
+            "refactorType": "introduceParam",
+            "paramName": "name",
+            "paramType": "String",
+        },
+        None,
+        True,
+        None,
+        id="introduce-parameter",
+    ),
+    pytest.param(
+        "Invalid.kt",
+        {"functionName": "test", "refactorType": "rename", "newName": "testRenamed"},
+        None,
+        False,
+        None,
+        id="compilation-failure",
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def kotlin_fixtures(tmp_path_factory: pytest.TempPathFactory) -> Dict[str, Path]:
+    """Every KOTLIN_SOURCES file, written once per session: file name -> path"""
+    project = tmp_path_factory.mktemp("kotlin_src", numbered=False)
+    paths = {}
+    for name, source in KOTLIN_SOURCES.items():
+        paths[name] = project / name
+        paths[name].write_text(source)
+    return paths
+
+
+@pytest.fixture(scope="session")
+def kotlin_project(kotlin_fixtures: Dict[str, Path]) -> Path:
+    """Project directory holding the Kotlin fixture files"""
+    return next(iter(kotlin_fixtures.values())).parent
+
+
+@pytest.fixture(scope="class")
+def shared_tools(kotlin_project: Path) -> IntelligentRefactoringTools:
+    """One tools instance per test class; preview refactors restore the sources"""
+    return IntelligentRefactoringTools(str(kotlin_project))
+
+
+@pytest.fixture(scope="class")
+def tool_stubs(shared_tools: IntelligentRefactoringTools) -> Tuple[AsyncMock, AsyncMock]:
+    """ktlint format_file and Gradle build_project stand-ins, installed once per class"""
+    shared_tools.ktlint.format_file = AsyncMock()  # type: ignore[method-assign]
+    shared_tools.gradle_api.build_project = AsyncMock()  # type: ignore[method-assign]
+    return shared_tools.ktlint.format_file, shared_tools.gradle_api.build_project
+
+
+class TestKotlinASTParser:
+    """Test cases for Kotlin AST parser."""
 
-        try:
-            symbols = self.parser.parse_file(temp_file)
+    def setup_method(self):
+        self.parser = KotlinASTParser()
 
-            assert "calculateTotal" in symbols
-            func_info = symbols["calculateTotal"]
-            assert func_info["type"] == "function"
-            assert len(func_info["parameters"]) == 2
-            assert func_info["parameters"][0]["name"] == "price"
-            assert func_info["parameters"][0]["type"] == "Double"
-            assert func_info["return_type"] == "Double"
-        finally:
-            Path(temp_file).unlink()
+    def test_parse_simple_class(self):
+        """Test parsing a simple Kotlin class."""
+        symbols = self.parser.parse_source(USER_CLASS_SOURCE)
+
+        assert "User" in symbols
+        assert symbols["User"]["type"] == "class"
+        assert "getDisplayName" in symbols
+        assert symbols["getDisplayName"]["type"] == "function"
+        assert "incrementAge" in symbols
+        assert "name" in symbols
+        assert symbols["name"]["type"] == "property"
+
+    def test_parse_function_with_parameters(self):
+        """Test parsing function with parameters."""
+        symbols = self.parser.parse_source(CALCULATE_TOTAL_SOURCE)
+
+        assert "calculateTotal" in symbols
+        func_info = symbols["calculateTotal"]
+        assert func_info["type"] == "function"
+        assert len(func_info["parameters"]) == 2
+        assert func_info["parameters"][0]["name"] == "price"
+        assert func_info["parameters"][0]["type"] == "Double"
+        assert func_info["return_type"] == "Double"
+
+    def test_parse_source_cached_by_content(self):
+        """Test that unchanged sources reuse the cached parse."""
+        kotlin_code = 'fun greet(): String {\n    return "Hi"\n}'
+
+        first = self.parser.parse_source(kotlin_code)
+        assert self.parser.parse_source(kotlin_code) is first
+        assert "greet" in first
+
+        changed = self.parser.parse_source(kotlin_code.replace("greet", "welcome"))
+        assert changed is not first
+        assert "welcome" in changed and "greet" not in changed
 
 
 class TestUnifiedDiffGenerator:
@@ -91,10 +233,7 @@ class TestUnifiedDiffGenerator:
 
     def test_generate_diff_simple_change(self):
         """Test generating diff for simple change."""
-        original = 'fun hello() {\n    println("Hello")\n}'
-        modified = 'fun hello() {\n    println("Hello World")\n}'
-
-        diff = UnifiedDiffGenerator.generate_diff(original, modified, "Test.kt")
+        diff = UnifiedDiffGenerator.generate_diff(HELLO_SOURCE, HELLO_WORLD_SOURCE, "Test.kt")
 
         assert "@@ -1,3 +1,3 @@" in diff
         assert '-    println("Hello")' in diff
@@ -102,80 +241,73 @@ class TestUnifiedDiffGenerator:
 
     def test_generate_diff_no_changes(self):
         """Test generating diff when no changes."""
-        content = 'fun hello() {\n    println("Hello")\n}'
-
-        diff = UnifiedDiffGenerator.generate_diff(content, content, "Test.kt")
+        diff = UnifiedDiffGenerator.generate_diff(HELLO_SOURCE, HELLO_SOURCE, "Test.kt")
 
         assert diff == ""
 
+    def test_generate_diff_normalizes_line_endings(self):
+        """Test that CRLF sources diff like their LF equivalents, repeat calls included."""
+        crlf_source = HELLO_SOURCE.replace("\n", "\r\n")
 
-class TestIntelligentRefactoringTools:
-    """Test cases for intelligent refactoring tools."""
-
-    def setup_method(self):
-        self.project_path = Path(tempfile.mkdtemp())
-        self.tools = IntelligentRefactoringTools(str(self.project_path))
+        for _ in range(2):
+            diff = UnifiedDiffGenerator.generate_diff(crlf_source, HELLO_WORLD_SOURCE, "Test.kt")
+            assert diff == UnifiedDiffGenerator.generate_diff(
+                HELLO_SOURCE, HELLO_WORLD_SOURCE, "Test.kt"
+            )
+            assert "\r" not in diff
 
-    def teardown_method(self):
-        # Clean up temp directory
-        import shutil
 
-        shutil.rmtree(self.project_path, ignore_errors=True)
+class TestIntelligentRefactoringTools:
+    """Test cases for intelligent refactoring tools."""
 
-    @pytest.mark.asyncio
-    async def test_rename_function_success(self):
-        """Test successful function rename."""
-        kotlin_code = """
-class Calculator {
-    fun add(a: Int, b: Int): Int {
-        return a + b
-    }
+    @pytest.fixture(autouse=True)
+    def setup_project(
+        self,
+        kotlin_fixtures: Dict[str, Path],
+        shared_tools: IntelligentRefactoringTools,
+        tool_stubs: Tuple[AsyncMock, AsyncMock],
+    ) -> None:
+        self.kotlin_files = kotlin_fixtures
+        self.tools = shared_tools
+
+        # Tests set the return values they need on the shared stand-ins
+        self.format_file, self.build_project = tool_stubs
+        self.format_file.reset_mock(return_value=True)
+        self.build_project.reset_mock(return_value=True)
+        self.build_project.return_value = {"success": True}
+
+    @pytest.mark.parametrize("file_name,arguments,formatted,compiles,diff_contains", REFACTOR_CASES)
+    async def test_refactor_preview(
+        self,
+        file_name: str,
+        arguments: Dict[str, Any],
+        formatted: Optional[str],
+        compiles: bool,
+        diff_contains: Optional[str],
+    ):
+        """Test each refactor type produces a preview diff, or reports compile failures."""
+        self.format_file.return_value = formatted or KOTLIN_SOURCES[file_name]
+        if not compiles:
+            self.build_project.return_value = {
+                "success": False,
+                "error": "Compilation failed: syntax error",
+            }
 
-    fun calculate() {
-        val result = add(5, 3)
-        println(result)
-    }
-}
-""".strip()
+        result = await self.tools.refactor_function(
+            {"filePath": str(self.kotlin_files[file_name]), "preview": True, **arguments}
+        )
 
-        # Create test file
-        test_file = self.project_path / "Calculator.kt"
-        test_file.write_text(kotlin_code)
+        if not compiles:
+            assert result["success"] is False
+            assert "compilation errors" in result["error"].lower()
+            return
 
-        # Mock ktlint to return modified content
-        modified_kotlin_code = """
-class Calculator {
-    fun sum(a: Int, b: Int): Int {
-        return a + b
-    }
+        assert result["success"] is True
+        assert "diff" in result
+        assert result["preview"] is True
+        if diff_contains:
+            assert diff_contains in result["diff"]
 
-    fun calculate() {
-        val result = sum(5, 3)
-        println(result)
-    }
-}
-""".strip()
-        with patch.object(self.tools.ktlint, "format_file", return_value=modified_kotlin_code):
-            # Mock gradle build to succeed
-            with patch.object(
-                self.tools.gradle_api, "build_project", return_value={"success": True}
-            ):
-                result = await self.tools.refactor_function(
-                    {
-                        "filePath": str(test_file),
-                        "functionName": "add",
-                        "refactorType": "rename",
-                        "newName": "sum",
-                        "preview": True,
-                    }
-                )
-
-                assert result["success"] is True
-                assert "diff" in result
-                assert "sum" in result["diff"]
-                assert result["preview"] is True
-
-    @pytest.mark.asyncio
     async def test_rename_function_missing_new_name(self):
         """Test rename function with missing new name."""
         result = await self.tools.refactor_function(
@@ -185,159 +317,24 @@ class Calculator {
         assert result["success"] is False
         assert "newName is required" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_extract_function_success(self):
-        """Test successful function extraction."""
-        kotlin_code = """
-fun processData() {
-    val data = listOf(1, 2, 3, 4, 5)
-    val filtered = data.filter { it > 2 }
-    val mapped = filtered.map { it * 2 }
-    println(mapped)
-}
-""".strip()
-
-        # Create test file
-        test_file = self.project_path / "Processor.kt"
-        test_file.write_text(kotlin_code)
-
-        # Mock ktlint and gradle
-        with patch.object(self.tools.ktlint, "format_file", return_value=kotlin_code):
-            with patch.object(
-                self.tools.gradle_api, "build_project", return_value={"success": True}
-            ):
-                result = await self.tools.refactor_function(
-                    {
-                        "filePath": str(test_file),
-                        "functionName": "processData",
-                        "refactorType": "extract",
-                        "newName": "transformData",
-                        "range": {"start": {"line": 2}, "end": {"line": 4}},
-                        "preview": True,
-                    }
-                )
-
-                assert result["success"] is True
-                assert "diff" in result
-
-    @pytest.mark.asyncio
-    async def test_inline_function_success(self):
-        """Test successful function inlining."""
-        kotlin_code = """
-fun getMessage(): String {
-    return "Hello World"
-}
-
-fun displayMessage() {
-    val message = getMessage()
-    println(message)
-}
-""".strip()
-
-        # Create test file
-        test_file = self.project_path / "Message.kt"
-        test_file.write_text(kotlin_code)
-
-        # Mock ktlint and gradle
-        with patch.object(self.tools.ktlint, "format_file", return_value=kotlin_code):
-            with patch.object(
-                self.tools.gradle_api, "build_project", return_value={"success": True}
-            ):
-                result = await self.tools.refactor_function(
-                    {
-                        "filePath": str(test_file),
-                        "functionName": "getMessage",
-                        "refactorType": "inline",
-                        "preview": True,
-                    }
-                )
-
-                assert result["success"] is True
-                assert "diff" in result
-
-    @pytest.mark.asyncio
-    async def test_introduce_parameter_success(self):
-        """Test successful parameter introduction."""
-        kotlin_code = """
-fun greet(): String {
-    return "Hello User"
-}
-""".strip()
-
-        # Create test file
-        test_file = self.project_path / "Greeter.kt"
-        test_file.write_text(kotlin_code)
-
-        # Mock ktlint and gradle
-        with patch.object(self.tools.ktlint, "format_file", return_value=kotlin_code):
-            with patch.object(
-                self.tools.gradle_api, "build_project", return_value={"success": True}
-            ):
-                result = await self.tools.refactor_function(
-                    {
-                        "filePath": str(test_file),
-                        "functionName": "greet",
-                        "refactorType": "introduceParam",
-                        "paramName": "name",
-                        "paramType": "String",
-                        "preview": True,
-                    }
-                )
-
-                assert result["success"] is True
-                assert "diff" in result
-
-    @pytest.mark.asyncio
-    async def test_compilation_failure_handling(self):
-        """Test handling of compilation failures."""
-        kotlin_code = "fun test() { invalid_syntax }"
-
-        # Create test file
-        test_file = self.project_path / "Invalid.kt"
-        test_file.write_text(kotlin_code)
-
-        # Mock ktlint to succeed but gradle to fail
-        with patch.object(self.tools.ktlint, "format_file", return_value=kotlin_code):
-            with patch.object(
-                self.tools.gradle_api,
-                "build_project",
-                return_value={"success": False, "error": "Compilation failed: syntax error"},
-            ):
-                result = await self.tools.refactor_function(
-                    {
-                        "filePath": str(test_file),
-                        "functionName": "test",
-                        "refactorType": "rename",
-                        "newName": "testRenamed",
-                        "preview": True,
-                    }
-                )
-
-                assert result["success"] is False
-                assert "compilation errors" in result["error"].lower()
-
-    def test_file_not_found(self):
+    async def test_file_not_found(self):
         """Test handling of non-existent files."""
-        result = asyncio.run(
-            self.tools.refactor_function(
-                {
-                    "filePath": "nonexistent.kt",
-                    "functionName": "test",
-                    "refactorType": "rename",
-                    "newName": "test2",
-                }
-            )
+        result = await self.tools.refactor_function(
+            {
+                "filePath": "nonexistent.kt",
+                "functionName": "test",
+                "refactorType": "rename",
+                "newName": "test2",
+            }
         )
 
         assert result["success"] is False
         assert "not found" in result["error"]
 
-    def test_unsupported_refactor_type(self):
+    async def test_unsupported_refactor_type(self):
         """Test handling of unsupported refactor types."""
-        result = asyncio.run(
-            self.tools.refactor_function(
-                {"filePath": "test.kt", "functionName": "test", "refactorType": "unsupported_type"}
-            )
+        result = await self.tools.refactor_function(
+            {"filePath": "test.kt", "functionName": "test", "refactorType": "unsupported_type"}
         )
 
         assert result["success"] is False
@@ -3,41 +3,61 @@ Tests for project root enforcement across all tools.
 """
 
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from server.utils.no_cwd_guard import assert_not_server_cwd
-from server.utils.project_resolver import ProjectRootError, find_gradle_cmd, resolve_project_root
+from server.utils.project_resolver import (
+    ProjectRootError,
+    clear_resolver_caches,
+    find_gradle_cmd,
+    resolve_project_root,
+)
 from tools.gradle_tools import GradleTools
 from tools.project_analysis import ProjectAnalysisTools
 from utils.security import SecurityManager
 
 
+@pytest.fixture(scope="session")
+def security_manager() -> SecurityManager:
+    """One SecurityManager for the session; the tools only read from it"""
+    return SecurityManager()
+
+
+def _touch_gradlew(path: Path, mode: int = 0o755) -> None:
+    """Create an empty gradlew with the given mode, set through the open descriptor"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        # The creation mode is filtered by the umask, so set it explicitly
+        os.fchmod(fd, mode)
+    finally:
+        os.close(fd)
+
+
 class TestProjectRootEnforcement:
     """Test project root resolution and enforcement."""
 
-    def test_resolve_project_root_from_input(self):
+    def test_resolve_project_root_from_input(self, tmp_path):
         """Test project root resolution from direct input."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = resolve_project_root({"project_root": tmpdir})
-            assert result == os.path.abspath(tmpdir)
+        tmpdir = str(tmp_path)
+        result = resolve_project_root({"project_root": tmpdir})
+        assert result == os.path.abspath(tmpdir)
 
-    def test_resolve_project_root_from_env(self):
+    def test_resolve_project_root_from_env(self, tmp_path):
         """Test project root resolution from environment variable."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            env = {"PROJECT_PATH": tmpdir}
-            result = resolve_project_root({}, env=env)
-            assert result == os.path.abspath(tmpdir)
+        tmpdir = str(tmp_path)
+        env = {"PROJECT_PATH": tmpdir}
+        result = resolve_project_root({}, env=env)
+        assert result == os.path.abspath(tmpdir)
 
-    def test_resolve_project_root_from_ide_meta(self):
+    def test_resolve_project_root_from_ide_meta(self, tmp_path):
         """Test project root resolution from IDE metadata."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            ide_meta = {"workspaceRoot": tmpdir}
-            result = resolve_project_root({}, ide_meta=ide_meta)
-            assert result == os.path.abspath(tmpdir)
+        tmpdir = str(tmp_path)
+        ide_meta = {"workspaceRoot": tmpdir}
+        result = resolve_project_root({}, ide_meta=ide_meta)
+        assert result == os.path.abspath(tmpdir)
 
     def test_resolve_project_root_missing_raises_error(self):
         """Test that missing project root raises appropriate error."""
@@ -49,6 +69,27 @@ class TestProjectRootEnforcement:
         with pytest.raises(ProjectRootError, match="ProjectRootInvalid"):
             resolve_project_root({"project_root": "/nonexistent/path"})
 
+    def test_resolve_project_root_cache_cleared(self, tmp_path):
+        """Test that a removed project root is rejected once resolver caches are cleared."""
+        tmpdir = str(tmp_path)
+        assert resolve_project_root({"project_root": tmpdir}) == os.path.abspath(tmpdir)
+        tmp_path.rmdir()
+
+        # Recently confirmed roots are trusted until the cache is cleared
+        assert resolve_project_root({"project_root": tmpdir}) == os.path.abspath(tmpdir)
+        clear_resolver_caches()
+        with pytest.raises(ProjectRootError, match="ProjectRootInvalid"):
+            resolve_project_root({"project_root": tmpdir})
+
+    def test_resolve_relative_project_root_follows_cwd(self, tmp_path, monkeypatch):
+        """Test that relative roots resolve against the current directory on every call."""
+        for name in ("first", "second"):
+            (tmp_path / name / "app").mkdir(parents=True)
+            monkeypatch.chdir(tmp_path / name)
+            assert resolve_project_root({"project_root": "app/../app"}) == str(
+                tmp_path / name / "app"
+            )
+
     def test_assert_not_server_cwd_with_server_cwd_raises(self):
         """Test that using server CWD raises error."""
         from server.utils.no_cwd_guard import SERVER_CWD
@@ -56,90 +97,103 @@ class TestProjectRootEnforcement:
         with pytest.raises(RuntimeError, match="ServerCwdMisuse"):
             assert_not_server_cwd(SERVER_CWD)
 
-    def test_assert_not_server_cwd_with_different_path_passes(self):
+    def test_assert_not_server_cwd_with_different_path_passes(self, tmp_path):
         """Test that using different path passes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Should not raise
-            assert_not_server_cwd(tmpdir)
+        tmpdir = str(tmp_path)
+        # Should not raise
+        assert_not_server_cwd(tmpdir)
 
-    def test_find_gradle_cmd_with_gradlew(self):
+    def test_find_gradle_cmd_with_gradlew(self, tmp_path):
         """Test finding gradlew wrapper."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create gradlew file
-            gradlew_path = Path(tmpdir) / "gradlew"
-            gradlew_path.touch()
-            gradlew_path.chmod(0o755)
-
-            cmd, working_dir, is_wrapper = find_gradle_cmd(tmpdir)
-            assert cmd == ["./gradlew"]
-            assert working_dir == tmpdir
-            assert is_wrapper is True
-
-    def test_find_gradle_cmd_no_gradle_raises_error(self):
+        tmpdir = str(tmp_path)
+        # Create gradlew file
+        gradlew_path = tmp_path / "gradlew"
+        _touch_gradlew(gradlew_path)
+
+        cmd, working_dir, is_wrapper = find_gradle_cmd(tmpdir)
+        assert cmd == ["./gradlew"]
+        assert working_dir == tmpdir
+        assert is_wrapper is True
+
+    def test_find_gradle_cmd_makes_wrapper_executable(self, tmp_path):
+        """Test that a checked-out gradlew without the executable bit is fixed up."""
+        gradlew_path = tmp_path / "gradlew"
+        _touch_gradlew(gradlew_path, 0o644)
+
+        assert find_gradle_cmd(str(tmp_path))[0] == ["./gradlew"]
+        assert os.access(gradlew_path, os.X_OK)
+
+    def test_find_gradle_cmd_no_gradle_raises_error(self, tmp_path):
         """Test that missing Gradle setup raises error."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(ProjectRootError, match="GradleNotFound"):
-                find_gradle_cmd(tmpdir)
+        tmpdir = str(tmp_path)
+        with pytest.raises(ProjectRootError, match="GradleNotFound"):
+            find_gradle_cmd(tmpdir)
+
+    def test_find_gradle_cmd_cached_per_root(self, tmp_path):
+        """Test that Gradle lookups are cached until resolver caches are cleared."""
+        tmpdir = str(tmp_path)
+        gradlew_path = tmp_path / "gradlew"
+        gradlew_path.touch()
+
+        cmd, _, _ = find_gradle_cmd(tmpdir)
+        cmd.append("build")  # callers may extend the returned command
+        gradlew_path.unlink()
+        assert find_gradle_cmd(tmpdir)[0] == ["./gradlew"]
+
+        clear_resolver_caches()
+        with pytest.raises(ProjectRootError, match="GradleNotFound"):
+            find_gradle_cmd(tmpdir)
 
 
 class TestToolProjectRootUsage:
     """Test that tools properly use project root resolution."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.security_manager = SecurityManager()
-
-    def test_gradle_tools_requires_project_root(self):
+    async def test_gradle_tools_requires_project_root(self, security_manager):
         """Test that GradleTools requires project_root."""
-        tools = GradleTools(Path("/tmp"), self.security_manager)
+        tools = GradleTools(Path("/tmp"), security_manager)
 
         # Should raise ProjectRootError when no project_root provided
         with pytest.raises(ProjectRootError):
-            import asyncio
-
-            asyncio.run(tools.gradle_build({}))
+            await tools.gradle_build({})
 
     @pytest.mark.skip(reason="Gradle execution tests are environment-specific and may fail in CI")
-    def test_gradle_tools_respects_project_path_env(self) -> None:
+    async def test_gradle_tools_respects_project_path_env(
+        self, tmp_path: Path, security_manager: SecurityManager
+    ) -> None:
         """Test that GradleTools respects PROJECT_PATH environment."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a basic Gradle project
-            gradlew_path = Path(tmpdir) / "gradlew"
-            gradlew_path.touch()
-            gradlew_path.chmod(0o755)
-
-            build_gradle = Path(tmpdir) / "build.gradle"
-            build_gradle.write_text("// test build file")
+        tmpdir = str(tmp_path)
+        # Create a basic Gradle project
+        gradlew_path = tmp_path / "gradlew"
+        _touch_gradlew(gradlew_path)
 
-            tools = GradleTools(Path("/tmp"), self.security_manager)
+        build_gradle = tmp_path / "build.gradle"
+        build_gradle.write_text("// test build file")
 
-            # Mock subprocess to avoid actual Gradle execution
-            with patch("asyncio.create_subprocess_exec") as mock_exec:
-                mock_process = MagicMock()
-                mock_process.returncode = 0
-                mock_process.communicate.return_value = (b"BUILD SUCCESSFUL", b"")
-                mock_exec.return_value = mock_process
+        tools = GradleTools(Path("/tmp"), security_manager)
 
-                # Set environment and call
-                arguments = {"project_root": tmpdir, "task": "assembleDebug"}
-                import asyncio
+        # Mock subprocess to avoid actual Gradle execution
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_process = MagicMock()
+            mock_process.returncode = 0
+            mock_process.communicate.return_value = (b"BUILD SUCCESSFUL", b"")
+            mock_exec.return_value = mock_process
 
-                result = asyncio.run(tools.gradle_build(arguments))
+            # Set environment and call
+            arguments = {"project_root": tmpdir, "task": "assembleDebug"}
+            result = await tools.gradle_build(arguments)
 
-                assert result["success"] is True
-                assert result["project_root"] == tmpdir
+            assert result["success"] is True
+            assert result["project_root"] == tmpdir
 
-    def test_project_analysis_tools_requires_project_root(self):
+    async def test_project_analysis_tools_requires_project_root(self, security_manager):
         """Test that ProjectAnalysisTools requires project_root."""
-        tools = ProjectAnalysisTools(Path("/tmp"), self.security_manager)
+        tools = ProjectAnalysisTools(Path("/tmp"), security_manager)
 
         # Should raise ProjectRootError when no project_root provided
         with pytest.raises(ProjectRootError):
-            import asyncio
-
-            asyncio.run(tools.analyze_project({}))
+            await tools.analyze_project({})
 
-    def test_tools_reject_server_cwd_misuse(self):
+    def test_tools_reject_server_cwd_misuse(self, security_manager):
         """Test that tools reject operations in server CWD."""
         from server.utils.no_cwd_guard import SERVER_CWD, assert_not_server_cwd
 
@@ -148,7 +202,7 @@ class TestToolProjectRootUsage:
             assert_not_server_cwd(SERVER_CWD)
 
         # Test with tools - but skip actual gradle execution since it's complex
-        tools = GradleTools(Path("/tmp"), self.security_manager)
+        tools = GradleTools(Path("/tmp"), security_manager)
 
         # Note: The actual gradle_build implementation may not call the guard in all cases
         # This test verifies the guard function itself works correctly
@@ -180,20 +234,65 @@ class TestInputNormalization:
         normalized = tool.normalize_inputs({"skipTests": True})
         assert normalized["skip_tests"] is True
 
-    def test_path_validation_under_project(self):
+    def test_path_validation_under_project(self, tmp_path):
         """Test path validation ensures files are under project root."""
         from server.utils.base_tool import BaseMCPTool
 
         tool = BaseMCPTool()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Valid path under project
-            valid_path = tool.validate_path_under_project("src/main.kt", tmpdir)
-            assert valid_path.startswith(tmpdir)
+        tmpdir = str(tmp_path)
+        # Valid path under project
+        valid_path = tool.validate_path_under_project("src/main.kt", tmpdir)
+        assert valid_path.startswith(tmpdir)
+
+        # Invalid absolute path outside project
+        with pytest.raises(ValueError, match="outside project root"):
+            tool.validate_path_under_project("/etc/passwd", tmpdir)
+
+        # Sibling directory sharing the root's name as a prefix
+        with pytest.raises(ValueError, match="outside project root"):
+            tool.validate_path_under_project(tmpdir + "-sibling/main.kt", tmpdir)
+
+    def test_path_validation_rejects_symlink_escape(self, tmp_path):
+        """Test that a symlink under the project root cannot point outside it."""
+        from server.utils.base_tool import BaseMCPTool
+
+        tool = BaseMCPTool()
+
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "main.kt").write_text("fun main() {}")
+        (project / "alias.kt").symlink_to(project / "main.kt")
+        (project / "escape.kt").symlink_to(tmp_path / "outside.kt")
+
+        assert tool.validate_path_under_project("alias.kt", str(project)) == str(
+            project / "alias.kt"
+        )
+        with pytest.raises(ValueError, match="links outside project root"):
+            tool.validate_path_under_project("escape.kt", str(project))
+
+    def test_path_validation_rejects_symlinked_parent_escape(self, tmp_path):
+        """Test that a path through a symlinked directory cannot lead outside the root."""
+        from server.utils.base_tool import BaseMCPTool
+
+        tool = BaseMCPTool()
+
+        project = tmp_path / "project"
+        (project / "src").mkdir(parents=True)
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.kt").write_text("val secret = 1")
+        (project / "linkdir").symlink_to(outside)
+        (project / "srclink").symlink_to(project / "src")
 
-            # Invalid absolute path outside project
-            with pytest.raises(ValueError, match="outside project root"):
-                tool.validate_path_under_project("/etc/passwd", tmpdir)
+        for file_path in ("linkdir/secret.kt", "linkdir/new.kt", "linkdir"):
+            with pytest.raises(ValueError, match="links outside project root"):
+                tool.validate_path_under_project(file_path, str(project))
+
+        # Links that stay inside the root are still accepted, for new files too
+        assert tool.validate_path_under_project("srclink/Main.kt", str(project)) == str(
+            project / "srclink" / "Main.kt"
+        )
 
 
 class TestIDEIntegration:
@@ -233,39 +332,40 @@ class TestCIGate:
             "tools/build_optimization.py",
         ]
 
+        # Resolve against the server package, not the directory pytest was started from
+        server_root = Path(__file__).resolve().parents[2]
         for tool_file in tool_files:
-            if Path(tool_file).exists():
-                content = Path(tool_file).read_text()
-                # Should not contain direct getcwd() calls
-                assert "os.getcwd()" not in content, f"Found os.getcwd() in {tool_file}"
-                assert "process.cwd()" not in content, f"Found process.cwd() in {tool_file}"
+            # Raw bytes are enough to search for ASCII call patterns; nothing is decoded
+            content = (server_root / tool_file).read_bytes()
+            # Should not contain direct getcwd() calls
+            assert b"os.getcwd()" not in content, f"Found os.getcwd() in {tool_file}"
+            assert b"process.cwd()" not in content, f"Found process.cwd() in {tool_file}"
 
     @pytest.mark.skip(reason="Gradle execution tests are environment-specific and may fail in CI")
-    def test_runtime_parity_with_project_path(self) -> None:
+    async def test_runtime_parity_with_project_path(
+        self, tmp_path: Path, security_manager: SecurityManager
+    ) -> None:
         """Test that tools work correctly when PROJECT_PATH is set."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create minimal project structure
-            gradlew_path = Path(tmpdir) / "gradlew"
-            gradlew_path.touch()
-            gradlew_path.chmod(0o755)
-
-            build_gradle = Path(tmpdir) / "build.gradle"
-            build_gradle.write_text("// test")
+        tmpdir = str(tmp_path)
+        # Create minimal project structure
+        gradlew_path = tmp_path / "gradlew"
+        _touch_gradlew(gradlew_path)
 
-            # Set PROJECT_PATH and test tool
-            with patch.dict(os.environ, {"PROJECT_PATH": tmpdir}):
-                tools = GradleTools(Path("/tmp"), SecurityManager())
+        build_gradle = tmp_path / "build.gradle"
+        build_gradle.write_text("// test")
 
-                with patch("asyncio.create_subprocess_exec") as mock_exec:
-                    mock_process = MagicMock()
-                    mock_process.returncode = 0
-                    mock_process.communicate.return_value = (b"BUILD SUCCESSFUL", b"")
-                    mock_exec.return_value = mock_process
+        # Set PROJECT_PATH and test tool
+        with patch.dict(os.environ, {"PROJECT_PATH": tmpdir}):
+            tools = GradleTools(Path("/tmp"), security_manager)
 
-                    import asyncio
+            with patch("asyncio.create_subprocess_exec") as mock_exec:
+                mock_process = MagicMock()
+                mock_process.returncode = 0
+                mock_process.communicate.return_value = (b"BUILD SUCCESSFUL", b"")
+                mock_exec.return_value = mock_process
 
-                    result = asyncio.run(tools.gradle_build({}))
+                result = await tools.gradle_build({})
 
-                    # Should succeed and use tmpdir as project root
-                    assert result["success"] is True
-                    assert result["project_root"] == tmpdir
+                # Should succeed and use tmpdir as project root
+                assert result["success"] is True
+                assert result["project_root"] == tmpdir
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test Suite for No Placeholders Utility
+Tests placeholder detection and cleanup for tool responses
+"""
+
+import pytest
+
+from server.utils.no_placeholders import (
+    clean_placeholder_content,
+    ensure_no_placeholders,
+    is_placeholder_response,
+    validate_tool_response,
+)
+
+
+class TestNoPlaceholders:
+    """Test suite for placeholder detection"""
+
+    def test_clean_payload_passes(self) -> None:
+        """Test that production-ready responses are accepted"""
+        response = {"content": [{"type": "text", "text": "Build succeeded in 12s"}]}
+        assert validate_tool_response(response) is response
+        assert not is_placeholder_response(response)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            "This feature is Coming Soon",
+            {"content": [{"type": "text", "text": "TODO: wire up the API"}]},
+            ["ok", {"nested": ["Lorem Ipsum dolor"]}],
+            {"setup_room_database": True},
+        ],
+    )
+    def test_placeholder_detected(self, payload) -> None:
+        """Test that fragments are found case-insensitively in strings, values and keys"""
+        with pytest.raises(RuntimeError, match="PlaceholderOutput: found '"):
+            ensure_no_placeholders(payload)
+
+    def test_reports_fragment_in_lowercase(self) -> None:
+        """Test that the error names the matched fragment"""
+        with pytest.raises(RuntimeError, match="found 'not implemented'"):
+            ensure_no_placeholders({"status": "NOT IMPLEMENTED"})
+
+    def test_shared_and_cyclic_payloads(self) -> None:
+        """Test that repeated and self-referencing containers are scanned once"""
+        shared = {"text": "ok"}
+        payload = {"a": shared, "b": [shared, shared]}
+        payload["self"] = payload
+        ensure_no_placeholders(payload)
+
+        shared["text"] = "coming soon"
+        with pytest.raises(RuntimeError, match="coming soon"):
+            ensure_no_placeholders(payload)
+
+    def test_non_dict_response_rejected(self) -> None:
+        """Test that tool responses must be dictionaries"""
+        with pytest.raises(RuntimeError, match="must be a dictionary"):
+            validate_tool_response(["done"])  # type: ignore[arg-type]
+
+    def test_clean_placeholder_content(self) -> None:
+        """Test that common placeholders are replaced preserving case"""
+        assert clean_placeholder_content("  TODO Placeholder text  ") == "Content text"
+        assert clean_placeholder_content("SAMPLE DATA and lorem ipsum") == "DATA and text content"
+        assert clean_placeholder_content("") == ""
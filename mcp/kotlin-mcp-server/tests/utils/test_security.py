@@ -4,24 +4,21 @@ Test Suite for Utils Security Module
 Tests security utilities and encryption functionality
 """
 
-import tempfile
-
 import pytest
 from cryptography.fernet import Fernet
 
 from kotlin_mcp_server import KotlinMCPServer
+from tests.conftest import assert_tool_result
 from utils.security import check_password, decrypt_data, encrypt_data, hash_password
 
 
 class TestSecurityUtils:
     """Test suite for security utilities functionality"""
 
-    @pytest.fixture
-    def server(self) -> "KotlinMCPServer":
-        """Create server instance for testing"""
-        server = KotlinMCPServer("test-server")
-        server.set_project_path(tempfile.mkdtemp())
-        return server
+    @pytest.fixture(autouse=True)
+    def cheap_bcrypt(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Hash with the minimum bcrypt cost; behaviour is the same at any cost"""
+        monkeypatch.setenv("MCP_BCRYPT_ROUNDS", "4")
 
     def test_encrypt_decrypt(self) -> None:
         """Test data encryption and decryption"""
@@ -38,47 +35,53 @@ class TestSecurityUtils:
         assert check_password(password, hashed)
         assert not check_password("wrong_password", hashed)
 
-    @pytest.mark.asyncio
+    def test_hash_password_rounds(self) -> None:
+        """Test that the bcrypt cost comes from the argument or MCP_BCRYPT_ROUNDS"""
+        assert hash_password("secret").startswith(b"$2b$04$")
+
+        hashed = hash_password("secret", rounds=5)
+        assert hashed.startswith(b"$2b$05$")
+        assert check_password("secret", hashed)
+
     async def test_encrypt_sensitive_data(self, server: KotlinMCPServer) -> None:
         """Test sensitive data encryption tool"""
-        result = await server.handle_call_tool(
-            "encrypt_sensitive_data", {"data_type": "personal_info", "encryption_method": "AES256"}
+        assert_tool_result(
+            await server.handle_call_tool(
+                "encrypt_sensitive_data",
+                {"data_type": "personal_info", "encryption_method": "AES256"},
+            )
         )
-        assert "content" in result
-        assert isinstance(result["content"], list)
 
-    @pytest.mark.asyncio
     async def test_setup_secure_storage(self, server: KotlinMCPServer) -> None:
         """Test secure storage setup"""
-        result = await server.handle_call_tool(
-            "setup_secure_storage",
-            {"storage_type": "encrypted_sharedprefs", "encryption_level": "AES256"},
+        assert_tool_result(
+            await server.handle_call_tool(
+                "setup_secure_storage",
+                {"storage_type": "encrypted_sharedprefs", "encryption_level": "AES256"},
+            )
         )
-        assert "content" in result
-        assert isinstance(result["content"], list)
 
-    @pytest.mark.asyncio
     async def test_setup_cloud_sync(self, server: KotlinMCPServer) -> None:
         """Test cloud sync setup"""
-        result = await server.handle_call_tool(
-            "setup_cloud_sync", {"provider": "firebase", "sync_type": "realtime"}
+        assert_tool_result(
+            await server.handle_call_tool(
+                "setup_cloud_sync", {"provider": "firebase", "sync_type": "realtime"}
+            )
         )
-        assert "content" in result
-        assert isinstance(result["content"], list)
 
-    @pytest.mark.asyncio
-    async def test_security_tools_variations(self, server: KotlinMCPServer) -> None:
-        """Test security tools with various configurations"""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "tool_name,args",
+        [
             ("encrypt_sensitive_data", {"data_type": "financial", "encryption_method": "RSA"}),
             ("setup_secure_storage", {"storage_type": "keystore", "encryption_level": "AES128"}),
             ("setup_cloud_sync", {"provider": "aws", "sync_type": "batch"}),
-        ]
-
-        for tool_name, args in test_cases:
-            result = await server.handle_call_tool(tool_name, args)
-            assert "content" in result
-            assert isinstance(result["content"], list)
+        ],
+    )
+    async def test_security_tools_variations(
+        self, server: KotlinMCPServer, tool_name: str, args: dict
+    ) -> None:
+        """Test security tools with various configurations"""
+        assert_tool_result(await server.handle_call_tool(tool_name, args))
 
     def test_encryption_with_different_keys(self) -> None:
         """Test encryption with different keys"""
@@ -109,7 +112,6 @@ class TestSecurityUtils:
         assert check_password(password, hash1)
         assert check_password(password, hash2)
 
-    @pytest.mark.asyncio
     async def test_security_edge_cases(self, server: KotlinMCPServer) -> None:
         """Test security tools with edge cases"""
         # Test with empty data type
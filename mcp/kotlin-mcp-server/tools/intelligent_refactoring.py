@@ -7,11 +7,13 @@ Kotlin code semantics and offer sophisticated refactoring capabilities.
 """
 
 import asyncio
+import difflib
 import hashlib
 import json
 import re
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -25,38 +27,49 @@ class UnifiedDiffGenerator:
     @staticmethod
     def generate_diff(original: str, modified: str, file_path: str) -> str:
         """Generate unified diff between original and modified content."""
-        import difflib
+        return _unified_diff(original, modified, file_path)
 
-        def to_unix(s: str) -> str:
-            return s.replace("\r\n", "\n").replace("\r", "\n")
 
-        def ensure_trailing_newline(s: str) -> str:
-            return s if not s or s.endswith("\n") else s + "\n"
+# Preview iterations diff the same buffers repeatedly, and the diff is a pure
+# function of its inputs, so recent results are reused
+@lru_cache(maxsize=32)
+def _unified_diff(original: str, modified: str, file_path: str) -> str:
+    """Unified diff with normalized line endings and one line of context"""
 
-        orig = ensure_trailing_newline(to_unix(original))
-        mod = ensure_trailing_newline(to_unix(modified))
+    def to_unix(s: str) -> str:
+        return s.replace("\r\n", "\n").replace("\r", "\n")
 
-        original_lines = orig.splitlines(keepends=True)
-        modified_lines = mod.splitlines(keepends=True)
+    def ensure_trailing_newline(s: str) -> str:
+        return s if not s or s.endswith("\n") else s + "\n"
 
-        diff = difflib.unified_diff(
-            original_lines,
-            modified_lines,
-            fromfile=f"a/{file_path}",
-            tofile=f"b/{file_path}",
-            lineterm="\n",
-            n=1,  # Context lines
-        )
+    orig = ensure_trailing_newline(to_unix(original))
+    mod = ensure_trailing_newline(to_unix(modified))
+
+    original_lines = orig.splitlines(keepends=True)
+    modified_lines = mod.splitlines(keepends=True)
+
+    diff = difflib.unified_diff(
+        original_lines,
+        modified_lines,
+        fromfile=f"a/{file_path}",
+        tofile=f"b/{file_path}",
+        lineterm="\n",
+        n=1,  # Context lines
+    )
 
-        return "".join(diff)
+    return "".join(diff)
 
 
 class KotlinASTParser:
     """Enhanced Kotlin AST parser for refactoring operations with better symbol resolution."""
 
+    # Parsed sources kept per parser, keyed by content digest
+    PARSE_CACHE_SIZE = 256
+
     def __init__(self) -> None:
         self.symbols: Dict[str, Dict[str, Any]] = {}
         self.call_sites: Dict[str, List[Dict[str, Any]]] = {}
+        self._parse_cache: Dict[bytes, Dict[str, Any]] = {}
 
     def parse_file(self, file_path: str) -> Dict[str, Any]:
         """Parse Kotlin file and extract symbols with enhanced analysis."""
@@ -66,8 +79,32 @@ class KotlinASTParser:
         except FileNotFoundError:
             return {}
 
+        symbols = self.parse_source(content)
+        self.symbols[file_path] = symbols
+        return symbols
+
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """Extract symbols from Kotlin source text without touching the filesystem.
+
+        Results are cached by content, so unchanged sources are not re-scanned; the
+        returned mapping is shared and must be treated as read-only.
+        """
+        key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            return cached
+
+        symbols = self._parse_source_uncached(content)
+        if len(self._parse_cache) >= self.PARSE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._parse_cache[next(iter(self._parse_cache))]
+        self._parse_cache[key] = symbols
+        return symbols
+
+    def _parse_source_uncached(self, content: str) -> Dict[str, Any]:
+        """Run the regex-based symbol extraction over content."""
         lines = content.split("\n")
-        symbols = {}
+        symbols: Dict[str, Any] = {}
 
         # Parse classes with better regex
         class_pattern = r"^\s*(?:(?:public|private|internal|protected)\s+)?(?:(?:abstract|open|sealed|data|enum)\s+)?class\s+(\w+)(?:\s*\([^)]*\))?(?:\s*:\s*[\w\s,&<>]+)?\s*{?"
@@ -124,7 +161,6 @@ class KotlinASTParser:
         # Find call sites for all symbols
         self._find_call_sites(content, symbols)
 
-        self.symbols[file_path] = symbols
         return symbols
 
     def _parse_parameters(self, params_str: str) -> List[Dict[str, Any]]:
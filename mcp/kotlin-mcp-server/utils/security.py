@@ -14,28 +14,41 @@ import os
 import sqlite3
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import bcrypt
 from cryptography.fernet import Fernet
 
+from config import Config
+
+
+@lru_cache(maxsize=32)
+def _fernet(key: bytes) -> Fernet:
+    """Fernet instance for key; instances hold no per-message state, so they are shared"""
+    return Fernet(key)
+
 
 def encrypt_data(data: bytes, key: bytes) -> bytes:
     """Encrypts data using Fernet symmetric encryption."""
-    f = Fernet(key)
-    return f.encrypt(data)
+    return _fernet(key).encrypt(data)
 
 
 def decrypt_data(token: bytes, key: bytes) -> bytes:
     """Decrypts data using Fernet symmetric encryption."""
-    f = Fernet(key)
-    return f.decrypt(token)
+    return _fernet(key).decrypt(token)
+
 
+def hash_password(password: str, rounds: Optional[int] = None) -> bytes:
+    """Hashes a password using bcrypt.
 
-def hash_password(password: str) -> bytes:
-    """Hashes a password using bcrypt."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    The work factor defaults to MCP_BCRYPT_ROUNDS (12); each extra round doubles
+    the cost. check_password reads it back from the hash, so it can change freely.
+    """
+    if rounds is None:
+        rounds = Config.get_int("MCP_BCRYPT_ROUNDS")
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds))
 
 
 def check_password(password: str, hashed: bytes) -> bool:
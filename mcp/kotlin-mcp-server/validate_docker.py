@@ -6,20 +6,109 @@ Validates Docker setup files and provides recommendations
 
 import json
 import os
+import platform
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Host platform ("darwin", "linux", "windows"), fixed for the life of the process
+PLATFORM_SYSTEM = platform.system().lower()
+
+# Version specifiers that count as pinning a requirement
+PIN_OPERATORS = (">=", "==", "~=")
+_PIN_RE = re.compile("|".join(map(re.escape, PIN_OPERATORS)))
+
+# Packages that are awkward in a headless container, with the advice to give
+PROBLEMATIC_PACKAGES = {
+    "opencv-python": "Consider using opencv-python-headless for Docker",
+    "tkinter": "GUI packages may not work in headless containers",
+    "pyqt": "GUI packages may not work in headless containers",
+}
+# Substring match, as before, so "pyqt5" and "opencv-python-headless" still count
+_PROBLEM_RE = re.compile("|".join(map(re.escape, PROBLEMATIC_PACKAGES)), re.IGNORECASE)
+
+# Results of the file checks from the last run, replayed while their inputs are unchanged
+CACHE_FILE = ".validate_docker_cache.json"
+
+
+def _file_signature(path: Path) -> Optional[List[int]]:
+    """Return [mtime_ns, size] for a file, or None when it does not exist"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _missing_markers(lines: Iterable[str], markers: Sequence[str]) -> List[str]:
+    """Return the markers found on none of the lines, in the order given"""
+    # Markers never span lines, so stream and stop as soon as every one has been seen
+    remaining = set(markers)
+    for line in lines:
+        remaining = {marker for marker in remaining if marker not in line}
+        if not remaining:
+            break
+    return [marker for marker in markers if marker in remaining]
 
 
 class DockerValidator:
     """Validates Docker configuration and setup"""
 
-    def __init__(self) -> None:
+    def __init__(self, use_cache: bool = True) -> None:
         self.project_root = Path(__file__).parent
         self.issues: List[str] = []
         self.warnings: List[str] = []
         self.recommendations: List[str] = []
+        self.use_cache = use_cache
+        self.cache_path = self.project_root / CACHE_FILE
+        self._cache: Dict[str, Any] = {}
+
+    def _load_cache(self) -> None:
+        """Read the previous run's check results; a missing or corrupt cache is empty"""
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        self._cache = cache if isinstance(cache, dict) else {}
+
+    def _save_cache(self) -> None:
+        """Persist check results for the next run; failing to write only costs a rescan"""
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump(self._cache, f)
+        except OSError:
+            pass
+
+    def _run_cached(self, check: Callable[[], bool], file_name: str) -> bool:
+        """Run a single-file check, or replay its last result if the file is unchanged"""
+        # The validator itself is part of the key, so editing a check invalidates it
+        signature = [
+            _file_signature(Path(__file__)),
+            _file_signature(self.project_root / file_name),
+        ]
+        findings = {
+            "issues": self.issues,
+            "warnings": self.warnings,
+            "recommendations": self.recommendations,
+        }
+
+        entry = self._cache.get(check.__name__)
+        if self.use_cache and isinstance(entry, dict) and entry.get("signature") == signature:
+            print(f"✅ {file_name} unchanged since last validation")
+            for kind, found in findings.items():
+                found.extend(entry[kind])
+            return bool(entry["result"])
+
+        before = {kind: len(found) for kind, found in findings.items()}
+        result = check()
+        entry = {kind: found[before[kind] :] for kind, found in findings.items()}
+        entry.update(signature=signature, result=result)
+        self._cache[check.__name__] = entry
+        return result
 
     def check_docker_files(self) -> bool:
         """Check if Docker configuration files exist and are valid"""
@@ -32,7 +121,6 @@ class DockerValidator:
             return False
 
         # Validate Dockerfile content
-        dockerfile_content = dockerfile_path.read_text()
         required_elements = [
             "FROM python:",
             "WORKDIR /app",
@@ -42,15 +130,18 @@ class DockerValidator:
             "CMD",
         ]
 
+        with open(dockerfile_path) as f:
+            missing = _missing_markers(f, required_elements + ["USER mcpuser", "HEALTHCHECK"])
+
         for element in required_elements:
-            if element not in dockerfile_content:
+            if element in missing:
                 self.issues.append(f"Dockerfile missing: {element}")
 
         # Check for security best practices
-        if "USER mcpuser" not in dockerfile_content:
+        if "USER mcpuser" in missing:
             self.warnings.append("Dockerfile should use non-root user")
 
-        if "HEALTHCHECK" not in dockerfile_content:
+        if "HEALTHCHECK" in missing:
             self.recommendations.append("Add HEALTHCHECK to Dockerfile")
 
         print("✅ Dockerfile validation complete")
@@ -68,8 +159,10 @@ class DockerValidator:
         try:
             import yaml  # type: ignore
 
+            # libyaml-backed safe loader when PyYAML was built with it, many times faster
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
             with open(compose_path) as f:
-                compose_config = yaml.safe_load(f)
+                compose_config = yaml.load(f, Loader=loader)  # nosec B506 - safe loaders only
 
             # Check required services
             if "services" not in compose_config:
@@ -108,12 +201,12 @@ class DockerValidator:
             self.recommendations.append("Create .dockerignore file to optimize builds")
             return True
 
-        content = dockerignore_path.read_text()
         recommended_ignores = ["__pycache__/", ".git/", "*.log", ".venv/", ".pytest_cache/"]
 
-        for ignore_pattern in recommended_ignores:
-            if ignore_pattern not in content:
-                self.recommendations.append(f"Add '{ignore_pattern}' to .dockerignore")
+        with open(dockerignore_path) as f:
+            missing = _missing_markers(f, recommended_ignores)
+        for ignore_pattern in missing:
+            self.recommendations.append(f"Add '{ignore_pattern}' to .dockerignore")
 
         print("✅ .dockerignore validation complete")
         return True
@@ -127,29 +220,23 @@ class DockerValidator:
             self.issues.append("requirements.txt not found")
             return False
 
-        content = req_path.read_text()
-
-        # Check for potentially problematic packages
-        problematic_packages = {
-            "opencv-python": "Consider using opencv-python-headless for Docker",
-            "tkinter": "GUI packages may not work in headless containers",
-            "pyqt": "GUI packages may not work in headless containers",
-        }
-
-        for package, warning in problematic_packages.items():
-            if package in content.lower():
+        # One streamed pass collects both the problematic packages and unpinned lines
+        found_packages = set()
+        unpinned = []
+        with open(req_path) as f:
+            for line in f:
+                found_packages.update(match.lower() for match in _PROBLEM_RE.findall(line))
+
+                # Check for version pinning
+                requirement = line.strip()
+                if requirement and not line.startswith("#"):
+                    if not _PIN_RE.search(requirement):
+                        unpinned.append(requirement)
+
+        for package, warning in PROBLEMATIC_PACKAGES.items():
+            if package in found_packages:
                 self.warnings.append(f"{package}: {warning}")
 
-        # Check for version pinning
-        lines = [
-            line.strip()
-            for line in content.split("\n")
-            if line.strip() and not line.startswith("#")
-        ]
-        unpinned = [
-            line for line in lines if ">=" not in line and "==" not in line and "~=" not in line
-        ]
-
         if unpinned:
             self.recommendations.append(f"Consider pinning versions for: {', '.join(unpinned[:3])}")
 
@@ -211,16 +298,24 @@ class DockerValidator:
         """Validate Docker build context"""
         print("📁 Validating build context...")
 
+        # Every name checked below sits directly in the project root, so list it once
+        # instead of stat'ing each candidate
+        try:
+            with os.scandir(self.project_root) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+
         required_files = ["kotlin_mcp_server.py", "requirements.txt", "pyproject.toml"]
 
         for file_name in required_files:
-            if not (self.project_root / file_name).exists():
+            if file_name not in names:
                 self.issues.append(f"Required file missing: {file_name}")
 
         # Check for large files that should be ignored
         large_dirs = ["__pycache__", ".git", "htmlcov", ".pytest_cache"]
         for dir_name in large_dirs:
-            if (self.project_root / dir_name).exists():
+            if dir_name in names:
                 self.recommendations.append(f"Ensure {dir_name} is in .dockerignore")
 
         print("✅ Build context validation complete")
@@ -230,12 +325,7 @@ class DockerValidator:
         """Generate Docker setup commands based on platform"""
         commands = []
 
-        # Detect platform
-        import platform
-
-        system = platform.system().lower()
-
-        if system == "darwin":  # macOS
+        if PLATFORM_SYSTEM == "darwin":  # macOS
             commands.extend(
                 [
                     "# macOS Docker Installation:",
@@ -244,7 +334,7 @@ class DockerValidator:
                     "",
                 ]
             )
-        elif system == "linux":
+        elif PLATFORM_SYSTEM == "linux":
             commands.extend(
                 [
                     "# Linux Docker Installation:",
@@ -257,7 +347,7 @@ class DockerValidator:
                     "",
                 ]
             )
-        elif system == "windows":
+        elif PLATFORM_SYSTEM == "windows":
             commands.extend(
                 [
                     "# Windows Docker Installation:",
@@ -288,20 +378,30 @@ class DockerValidator:
 
         success = True
 
-        # Check Docker installation
-        docker_installed, docker_msg = self.check_docker_installation()
+        # Check Docker installation; both probes just wait on CLI start-up, so run them
+        # side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            docker_future = executor.submit(self.check_docker_installation)
+            compose_future = executor.submit(self.check_docker_compose_installation)
+            docker_installed, docker_msg = docker_future.result()
+            compose_installed, compose_msg = compose_future.result()
+
         if not docker_installed:
             self.warnings.append(f"Docker: {docker_msg}")
 
-        compose_installed, compose_msg = self.check_docker_compose_installation()
         if not compose_installed:
             self.warnings.append(f"Docker Compose: {compose_msg}")
 
-        # Check configuration files
-        success &= self.check_docker_files()
-        success &= self.check_docker_compose()
-        success &= self.check_dockerignore()
-        success &= self.check_requirements_compatibility()
+        # Check configuration files; each of these reads a single file, so their results
+        # are reused while that file is unchanged
+        if self.use_cache:
+            self._load_cache()
+        success &= self._run_cached(self.check_docker_files, "Dockerfile")
+        success &= self._run_cached(self.check_docker_compose, "docker-compose.yml")
+        success &= self._run_cached(self.check_dockerignore, ".dockerignore")
+        success &= self._run_cached(self.check_requirements_compatibility, "requirements.txt")
+        if self.use_cache:
+            self._save_cache()
         success &= self.validate_build_context()
 
         # Print results
@@ -347,7 +447,8 @@ class DockerValidator:
 
 def main() -> int:
     """Main validation function"""
-    validator = DockerValidator()
+    # --no-cache rescans every file, e.g. after installing PyYAML
+    validator = DockerValidator(use_cache="--no-cache" not in sys.argv[1:])
     success = validator.run_validation()
     return 0 if success else 1
 
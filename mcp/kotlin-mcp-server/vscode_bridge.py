@@ -6,71 +6,372 @@ This creates a simple HTTP API that VS Code extensions can call
 
 import json
 import os
+import re
+import stat
 import subprocess
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    # python-isal: zlib-compatible gzip with hand-tuned SIMD code, several times faster
+    from isal import igzip as gzip
+
+    HAS_ISAL = True
+except ImportError:
+    import gzip  # type: ignore[no-redef]
+
+    HAS_ISAL = False
+
+# Requests are served on their own threads, but each tool call occupies an MCP server
+# process, so only this many run at once and the rest queue
+_TOOL_CALL_SLOTS = threading.BoundedSemaphore(
+    max(1, int(os.getenv("MCP_BRIDGE_MAX_TOOL_CALLS", "4")))
+)
+
+# Tools advertised by the /health endpoint
+HEALTH_TOOLS = (
+    "gradle_build",
+    "run_tests",
+    "create_kotlin_file",
+    "create_layout_file",
+    "analyze_project",
+)
+
+# Tool names are passed to the MCP server, so only plain identifiers are accepted
+_TOOL_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+# Largest request body accepted; tool calls are small JSON documents
+MAX_REQUEST_BODY = 4 * 1024 * 1024
+
+# Response bodies at least this large are gzipped for clients that accept it; level 1
+# is nearly free on CPU and still shrinks JSON severalfold
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 1
+
+# Installed MCP server entry point (see install.py)
+MCP_SERVER_COMMAND = "kotlin-android-mcp"
+
+# Seconds a tool call may run before its MCP server process is killed
+TOOL_CALL_TIMEOUT = 30
+# Seconds an idle MCP server process is kept for reuse before it is shut down
+WORKER_IDLE_TIMEOUT = float(os.getenv("MCP_BRIDGE_WORKER_IDLE_TIMEOUT", "300"))
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson is stricter about key and integer types; fall back to stdlib
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (and does not set its q to 0)"""
+    for coding in accept_encoding.split(","):
+        name, *params = coding.split(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+@lru_cache(maxsize=1)
+def _default_workspace() -> str:
+    """Workspace used when a request names none: the VS Code folder, else the bridge's cwd
+
+    Neither changes while the bridge runs, so they are read once.
+    """
+    return os.getenv("VSCODE_WORKSPACE_FOLDER") or os.getcwd()
+
+
+@lru_cache(maxsize=1)
+def _health_body() -> bytes:
+    """Serialized /health response, built once; nothing in it changes while running"""
+    workspace_info = {
+        "status": "healthy",
+        "current_workspace": _default_workspace(),
+        "available_tools": list(HEALTH_TOOLS),
+    }
+    return _dumps(workspace_info)
+
+
+class ProjectPathError(ValueError):
+    """A project path that resolves, but not to an existing directory"""
+
+
+@lru_cache(maxsize=256)
+def _resolve_project_path(project_path: str) -> str:
+    """Resolve a project path and check it is a directory
+
+    A session sends the same workspace path with nearly every call, so successful
+    checks are cached. Failures raise and are therefore never cached, so a
+    directory created later is picked up.
+    """
+    validated_path = os.path.realpath(project_path)
+
+    # Basic security checks, from a single stat of the resolved path
+    try:
+        st = os.stat(validated_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise ProjectPathError(f"Project path does not exist: {project_path}") from None
+
+    if not stat.S_ISDIR(st.st_mode):
+        raise ProjectPathError(f"Project path is not a directory: {project_path}")
+
+    return validated_path
+
+
+class MCPWorker:
+    """One long-lived MCP server process answering line-delimited JSON-RPC on stdio"""
+
+    def __init__(self, project_path: str) -> None:
+        self.project_path = project_path
+        self.last_used = time.monotonic()
+        self._next_id = 0
+        self._timed_out = False
+        self._stderr_tail: Deque[bytes] = deque(maxlen=20)
+        self.process = subprocess.Popen(
+            (MCP_SERVER_COMMAND, project_path),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            # The server's environment, pointed at this worker's project
+            env={**os.environ, "PROJECT_PATH": project_path},
+            shell=False,  # Explicitly disable shell execution
+        )
+        # The server logs to stderr for as long as it runs; drain it so the pipe never
+        # fills, keeping the last lines for error reports
+        self._stderr_reader = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_reader.start()
+
+    def _drain_stderr(self) -> None:
+        for line in self.process.stderr:
+            self._stderr_tail.append(line)
+
+    def _kill_on_timeout(self) -> None:
+        self._timed_out = True
+        self.process.kill()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process is still running"""
+        return self.process.poll() is None
+
+    def call(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one request and return the response message carrying its id
+
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives within timeout
+            json.JSONDecodeError: If the server writes something other than JSON
+            RuntimeError: If the server exits before responding
+        """
+        self._next_id += 1
+        request_id = self._next_id
+        request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+        # Reads block, so the deadline is enforced by killing the process, which
+        # ends the read with EOF
+        watchdog = threading.Timer(timeout, self._kill_on_timeout)
+        watchdog.start()
+        try:
+            self.process.stdin.write(_dumps(request) + b"\n")
+            self.process.stdin.flush()
+            for line in iter(self.process.stdout.readline, b""):
+                if not line.strip():
+                    continue
+                message = _loads(line)
+                # Skip notifications and anything else that does not answer this request
+                if isinstance(message, dict) and message.get("id") == request_id:
+                    return message
+        except BrokenPipeError:
+            # The server closed its end; make sure it is gone before reporting
+            self.process.kill()
+        finally:
+            watchdog.cancel()
+
+        if self._timed_out:
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        self.process.wait()
+        self._stderr_reader.join(timeout=1)
+        raise RuntimeError(b"".join(self._stderr_tail).decode("utf-8", "replace"))
+
+    def close(self) -> None:
+        """Stop the process"""
+        if self.alive:
+            self.process.kill()
+        self.process.wait()
+
+
+class MCPWorkerPool:
+    """Idle MCP server processes, kept per project path and reused across tool calls"""
+
+    def __init__(self, idle_timeout: float) -> None:
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._idle: Dict[str, List[MCPWorker]] = {}
+        self._reaper_started = False
+
+    def acquire(self, project_path: str) -> MCPWorker:
+        """Check out an idle worker for project_path, starting one if none is free"""
+        with self._lock:
+            idle = self._idle.get(project_path, [])
+            while idle:
+                worker = idle.pop()
+                if worker.alive:
+                    return worker
+        return MCPWorker(project_path)
+
+    def release(self, worker: MCPWorker) -> None:
+        """Return a worker after a successful call; failed workers are closed instead"""
+        worker.last_used = time.monotonic()
+        with self._lock:
+            self._idle.setdefault(worker.project_path, []).append(worker)
+            if not self._reaper_started:
+                self._reaper_started = True
+                threading.Thread(target=self._reap_forever, daemon=True).start()
+
+    def _reap_forever(self) -> None:
+        while True:
+            time.sleep(max(1.0, self.idle_timeout / 2))
+            self.close_idle(older_than=self.idle_timeout)
+
+    def close_idle(self, older_than: float = 0.0) -> None:
+        """Close idle workers unused for at least older_than seconds"""
+        cutoff = time.monotonic() - older_than
+        stale = []
+        with self._lock:
+            for project_path, workers in list(self._idle.items()):
+                keep = [w for w in workers if w.alive and w.last_used > cutoff]
+                stale.extend(w for w in workers if w not in keep)
+                if keep:
+                    self._idle[project_path] = keep
+                else:
+                    del self._idle[project_path]
+        for worker in stale:
+            worker.close()
+
+
+_WORKER_POOL = MCPWorkerPool(WORKER_IDLE_TIMEOUT)
 
 
 class MCPBridgeHandler(BaseHTTPRequestHandler):
+    # Keep connections open between calls; every response carries a Content-Length
+    protocol_version = "HTTP/1.1"
+    # Seconds an idle kept-alive connection holds its thread before it is closed
+    timeout = 60
+    # Buffer writes so the header block and body leave in one send; the server flushes
+    # after each request
+    wbufsize = -1
+    # Set TCP_NODELAY on each connection so small replies are not held back by Nagle
+    disable_nagle_algorithm = True
+
+    def _send_json(self, status: int, body: bytes, cors: bool = False, close: bool = False) -> None:
+        """Send a JSON response body with its length, gzipped when worthwhile"""
+        compress = len(body) >= GZIP_MIN_SIZE and _accepts_gzip(
+            self.headers.get("Accept-Encoding", "")
+        )
+        if compress:
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+        self.send_response(status)
+        self.send_header("Content-type", "application/json")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Vary", "Accept-Encoding")
+        if cors:
+            self.send_header("Access-Control-Allow-Origin", "*")
+        if close:
+            # Also makes the server drop the connection after this response
+            self.send_header("Connection", "close")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_POST(self):
-        content_length = int(self.headers["Content-Length"])
+        # Bodies that are missing or oversized are never read, so the connection is closed
+        # rather than reused with the unread bytes still on it
+        try:
+            content_length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self._send_json(411, _dumps({"error": "Content-Length required"}), close=True)
+            return
+        if content_length > MAX_REQUEST_BODY:
+            error_response = {"error": f"Request body exceeds {MAX_REQUEST_BODY} bytes"}
+            self._send_json(413, _dumps(error_response), close=True)
+            return
+
         post_data = self.rfile.read(content_length)
 
         try:
-            request_data = json.loads(post_data)
-            tool_name = request_data.get("tool")
-            arguments = request_data.get("arguments", {})
+            request_data = _loads(post_data)
+            # A list body is shorthand for {"batch": [...]}
+            if isinstance(request_data, list):
+                request_data = {"batch": request_data}
 
             # Get project path from request or use VS Code workspace
-            project_path = request_data.get("project_path")
-            if not project_path:
-                # Try to get from VS Code workspace environment
-                project_path = os.getenv("VSCODE_WORKSPACE_FOLDER")
-            if not project_path:
-                # Fallback to current working directory
-                project_path = os.getcwd()
-
-            # Call the MCP server
-            result = self.call_mcp_tool(tool_name, arguments, project_path)
-
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
+            project_path = request_data.get("project_path") or _default_workspace()
 
-            response = {"result": result, "project_path": project_path}
-            self.wfile.write(json.dumps(response).encode())
+            if "batch" in request_data:
+                response = {
+                    "results": self.call_mcp_batch(request_data["batch"], project_path),
+                    "project_path": project_path,
+                }
+            else:
+                tool_name = request_data.get("tool")
+                arguments = request_data.get("arguments", {})
 
-        except Exception as e:
-            self.send_response(500)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
+                # Call the MCP server
+                with _TOOL_CALL_SLOTS:
+                    result = self.call_mcp_tool(tool_name, arguments, project_path)
+
+                response = {"result": result, "project_path": project_path}
+            body = _dumps(response)
 
+        except Exception as e:
             error_response = {"error": str(e)}
-            self.wfile.write(json.dumps(error_response).encode())
+            self._send_json(500, _dumps(error_response))
+            return
+
+        self._send_json(200, body, cors=True)
 
     def do_GET(self):
         """Health check and project info endpoint"""
         if self.path == "/health":
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-
             # Return current workspace info
-            workspace_info = {
-                "status": "healthy",
-                "current_workspace": os.getenv("VSCODE_WORKSPACE_FOLDER", os.getcwd()),
-                "available_tools": [
-                    "gradle_build",
-                    "run_tests",
-                    "create_kotlin_file",
-                    "create_layout_file",
-                    "analyze_project",
-                ],
-            }
-
-            self.wfile.write(json.dumps(workspace_info).encode())
+            self._send_json(200, _health_body())
         else:
             self.send_response(404)
+            self.send_header("Content-Length", "0")
             self.end_headers()
 
     def do_OPTIONS(self):
@@ -78,71 +379,63 @@ class MCPBridgeHandler(BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
+    def call_mcp_batch(self, calls, project_path):
+        """Run several tool calls for one HTTP request, returning results in order
+
+        The calls share one tool-call slot and run one after another, so they reuse a
+        single pooled MCP server process. Each entry gets its own result, and a failed
+        call does not stop the ones after it.
+        """
+        if not isinstance(calls, list):
+            raise ValueError("batch must be a list of tool calls")
+
+        results = []
+        with _TOOL_CALL_SLOTS:
+            for call in calls:
+                if not isinstance(call, dict):
+                    results.append({"error": "Invalid batch entry: expected an object"})
+                    continue
+                results.append(
+                    self.call_mcp_tool(call.get("tool"), call.get("arguments", {}), project_path)
+                )
+        return results
+
     def call_mcp_tool(self, tool_name, arguments, project_path):
         """Call the MCP server tool via command line with security validation"""
 
         # Validate project_path to prevent command injection
         try:
-            from pathlib import Path
-
-            validated_path = Path(project_path).resolve()
-
-            # Basic security checks
-            if not validated_path.exists():
-                return {"error": f"Project path does not exist: {project_path}"}
-
-            if not validated_path.is_dir():
-                return {"error": f"Project path is not a directory: {project_path}"}
-
-            # Convert back to string for subprocess
-            safe_project_path = str(validated_path)
-
+            safe_project_path = _resolve_project_path(project_path)
+        except ProjectPathError as e:
+            return {"error": str(e)}
         except (OSError, ValueError) as e:
             return {"error": f"Invalid project path: {e}"}
 
         # Validate tool_name to prevent injection
-        if not tool_name.replace("_", "").replace("-", "").isalnum():
+        if not isinstance(tool_name, str) or not _TOOL_NAME_RE.fullmatch(tool_name):
             return {"error": f"Invalid tool name: {tool_name}"}
 
-        cmd = ["kotlin-android-mcp", safe_project_path]
-
-        # Create a mock JSON-RPC request
-        request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {"name": tool_name, "arguments": arguments},
-        }
-
         try:
-            # Set environment variable for the subprocess
-            env = os.environ.copy()
-            env["PROJECT_PATH"] = safe_project_path
-
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                env=env,
-                shell=False,  # Explicitly disable shell execution
-            )
-
-            stdout, stderr = process.communicate(json.dumps(request), timeout=30)
-
-            if process.returncode == 0:
-                response = json.loads(stdout)
-                return response.get("result", {})
-            else:
-                return {"error": stderr}
+            # Only a newly started worker needs an environment, so none is built here
+            worker = _WORKER_POOL.acquire(safe_project_path)
+            try:
+                response = worker.call(
+                    "tools/call", {"name": tool_name, "arguments": arguments}, TOOL_CALL_TIMEOUT
+                )
+            except BaseException:
+                # Its state is unknown after a failed call, so never hand it out again
+                worker.close()
+                raise
+            _WORKER_POOL.release(worker)
+            return response.get("result", {})
 
         except subprocess.TimeoutExpired:
-            process.kill()
             return {"error": "Command timeout"}
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses it, so this covers both parsers
             return {"error": f"Invalid JSON response: {e}"}
         except Exception as e:
             return {"error": str(e)}
@@ -154,19 +447,27 @@ def start_bridge_server(port=8080):
     port = int(os.getenv("MCP_BRIDGE_PORT", port))
 
     server_address = (host, port)
-    httpd = HTTPServer(server_address, MCPBridgeHandler)
-
-    print(f"🌐 MCP Bridge Server running on http://{host}:{port}")
-    print("📁 Workspace-aware Android MCP bridge for VS Code")
-    print(f"🔍 Health check: http://{host}:{port}/health")
-    print("\n📋 Usage in VS Code extension:")
-    print(f"   POST http://{host}:{port}/ with JSON: {{tool: 'tool_name', arguments: {{...}}}}")
-    print("   The bridge will automatically use the current VS Code workspace")
+    # One thread per request, so a long tool call never holds up health checks
+    httpd = ThreadingHTTPServer(server_address, MCPBridgeHandler)
+    httpd.daemon_threads = True
+
+    # One write for the whole banner rather than a write and flush per line
+    print(
+        f"🌐 MCP Bridge Server running on http://{host}:{port}\n"
+        "📁 Workspace-aware Android MCP bridge for VS Code\n"
+        f"🔍 Health check: http://{host}:{port}/health\n"
+        "\n📋 Usage in VS Code extension:\n"
+        f"   POST http://{host}:{port}/ with JSON: {{tool: 'tool_name', arguments: {{...}}}}\n"
+        "   The bridge will automatically use the current VS Code workspace",
+        flush=True,
+    )
 
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n🛑 Bridge server stopped")
+    finally:
+        _WORKER_POOL.close_idle()
 
 
 if __name__ == "__main__":